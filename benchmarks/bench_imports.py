@@ -0,0 +1,106 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# BENCHMARK: Page import cost (python -X importtime)
+# ======================================================
+#
+# python benchmarks/bench_imports.py [--repeat 5] [--top 8] [--out FILE]
+#
+# For every page, runs the page's top-level imports in a fresh
+# interpreter under -X importtime, with streamlit already loaded as it
+# is inside the running server. Reports the wall time of the page's
+# import block (what a cold navigation pays before the upload widget
+# appears), the packages that cost the most, and which heavy libraries
+# got pulled in.
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ["main.py", "pages/sales.py", "pages/employee.py", "pages/cellsum.py"]
+HEAVY = ["matplotlib", "reportlab", "pyarrow", "openpyxl", "python_calamine", "PIL"]
+
+PROBE = """
+import sys, time
+import streamlit
+before = set(sys.modules)
+t = time.perf_counter()
+{imports}
+print(time.perf_counter() - t)
+print(",".join(m for m in {heavy!r} if m in sys.modules and m not in before))
+"""
+
+
+def page_imports(path):
+    """The page's top-level import statements as source."""
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(
+        ast.unparse(node) for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def probe(path):
+    """(seconds, heavy modules loaded, importtime lines) for one cold run."""
+    code = PROBE.format(imports=page_imports(path), heavy=HEAVY)
+    run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    seconds, heavy = run.stdout.splitlines()[-2:]
+    return float(seconds), [m for m in heavy.split(",") if m], run.stderr.splitlines()
+
+
+def top_packages(lines, top):
+    """Packages the page pulled in, by total self time (us) of their modules."""
+    seen, self_time = False, {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        own, _, raw = line[len("import time:"):].split("|")
+        name = raw.strip()
+        if name == "imported package":
+            continue
+        # Lines finish child-first; up to streamlit's own line is preloading
+        if not seen:
+            seen = name == "streamlit"
+            continue
+        package = name.split(".")[0]
+        self_time[package] = self_time.get(package, 0) + int(own)
+    return sorted(self_time.items(), key=lambda kv: kv[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure page import cost")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--out", help="JSON results file")
+    args = parser.parse_args()
+
+    results = []
+    for path in PAGES:
+        runs = [probe(path) for _ in range(args.repeat)]
+        seconds = statistics.median(r[0] for r in runs)
+        heavy, lines = runs[-1][1], runs[-1][2]
+        packages = top_packages(lines, args.top)
+        results.append({"page": path, "median_s": seconds, "heavy": heavy,
+                        "top_packages_us": dict(packages)})
+
+        print(f"{path:<20}{seconds * 1000:>8.1f}ms   heavy: {', '.join(heavy) or '—'}")
+        for name, us in packages:
+            print(f"{'':<22}{name:<24}{us / 1000:>8.1f}ms")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"python": sys.version.split()[0], "repeat": args.repeat,
+                       "results": results}, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
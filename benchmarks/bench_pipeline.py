@@ -0,0 +1,197 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# BENCHMARK: Report pipeline, stage by stage
+# ======================================================
+#
+# python benchmarks/bench_pipeline.py [--rows 10 1000 10000] [--repeat 3]
+#                                     [--out FILE] [--compare OLD.json]
+#
+# Times every stage of the sales and employee reports on synthetic
+# workbooks: read_excel, cleaning, banding, sorting, action plan,
+# matplotlib rendering and the ReportLab build. Results are written as
+# JSON (default benchmarks/results/pipeline-<commit>.json) so two
+# commits can be compared with --compare.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import branch_workbook, staff_workbook  # noqa: E402
+from cellpoint import charts  # noqa: E402
+from cellpoint.analytics import action_plan, company_summary, score_staff, staff_leaders  # noqa: E402
+from cellpoint.bands import RISK_LEVEL  # noqa: E402
+from cellpoint.ingest import (  # noqa: E402
+    BRANCH_COLUMNS, STAFF_COLUMNS, clean_branch_frame, clean_staff_frame
+)
+from cellpoint.pdf import (  # noqa: E402
+    generate_complete_pdf, generate_employee_pdf, prediction_graph_image
+)
+from cellpoint.readers import default_backend, read_sheet  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ["pandas", "numpy", "openpyxl", "python-calamine", "matplotlib", "reportlab"]
+
+# Fixed month position so runs are comparable
+DAYS_COMPLETED, TOTAL_DAYS = 20, 31
+DAYS_REMAINING = TOTAL_DAYS - DAYS_COMPLETED
+
+
+# ======================================================
+# STAGES
+# ======================================================
+def sales_stages(data):
+    """(stage, fn) pairs; each fn takes the previous stage's output."""
+
+    def banding(df):
+        df["ACHIEVEMENT %"] = (df["ACHIEVEMENT"] / df["MONTHLY TARGET"]) * 100
+        df["RISK LEVEL"] = RISK_LEVEL.classify(df["ACHIEVEMENT %"])
+        return df
+
+    def build_pdf(state):
+        df, action_df, chart = state
+        summary = company_summary(df)
+        predicted_final = summary["company_ach"] * TOTAL_DAYS / DAYS_COMPLETED
+        return generate_complete_pdf(
+            df, summary["status_text"], summary["company_pct"], summary["top_risk"],
+            "benchmark", summary["company_ach"], predicted_final, summary["company_trgt"],
+            action_df, "CellPoint 1", "2026-01-20", DAYS_COMPLETED, DAYS_REMAINING, TOTAL_DAYS
+        )
+
+    def chart(df):
+        charts.clear()  # time the render, not the PNG cache
+        ach, trgt = df["ACHIEVEMENT"].sum(), df["MONTHLY TARGET"].sum()
+        return prediction_graph_image(ach, ach * TOTAL_DAYS / DAYS_COMPLETED, trgt,
+                                      DAYS_COMPLETED, TOTAL_DAYS)
+
+    return [
+        ("read_excel", lambda _: read_sheet(data, columns=BRANCH_COLUMNS, stop_at="TOTAL")),
+        ("cleaning", clean_branch_frame),
+        ("banding", banding),
+        ("sorting", lambda df: df.sort_values(by="ACHIEVEMENT %", ascending=False)),
+        ("action_plan", lambda df: (df, action_plan(df, DAYS_REMAINING))),
+        ("matplotlib", lambda s: (s[0], s[1], chart(s[0]))),
+        ("reportlab", build_pdf),
+    ]
+
+
+def staff_stages(data):
+
+    def build_pdf(state):
+        df, leaders = state
+        return generate_employee_pdf(
+            df, leaders["df_handset"], leaders["df_accessory"], leaders["df_combined"],
+            leaders["effective_top"], leaders["effective_top_handset"],
+            leaders["effective_top_accessory"], leaders["risk_accessory"],
+            leaders["team_avg_pct"], leaders["team_status"], "CellPoint 1", "2026-01-20"
+        )
+
+    return [
+        ("read_excel", lambda _: read_sheet(data, columns=STAFF_COLUMNS, header_rows=2,
+                                            first_column="SALESMAN", stop_at="TOTAL")),
+        ("cleaning", clean_staff_frame),
+        ("banding", score_staff),
+        ("sorting", lambda df: (df, staff_leaders(df))),
+        ("reportlab", build_pdf),
+    ]
+
+
+SHEETS = {"branch": (branch_workbook, sales_stages), "staff": (staff_workbook, staff_stages)}
+
+
+def time_stages(stages, repeat):
+    """Median / min seconds per stage; every run replays the whole chain."""
+    runs = {name: [] for name, _ in stages}
+    for _ in range(repeat):
+        value = None
+        for name, fn in stages:
+            start = time.perf_counter()
+            value = fn(value)
+            runs[name].append(time.perf_counter() - start)
+    return {name: (statistics.median(t), min(t)) for name, t in runs.items()}
+
+
+# ======================================================
+# RESULTS
+# ======================================================
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def package_versions():
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = version(name)
+        except PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def compare(results, old_path):
+    with open(old_path) as f:
+        old = {(r["sheet"], r["rows"], r["stage"]): r["median_s"] for r in json.load(f)["results"]}
+    print(f"\nvs {old_path}")
+    for r in results:
+        before = old.get((r["sheet"], r["rows"], r["stage"]))
+        if before:
+            change = (r["median_s"] - before) / before * 100
+            print(f"{r['sheet']:<8}{r['rows']:>8}  {r['stage']:<12}{change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the report pipeline stage by stage")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sheets", nargs="+", choices=list(SHEETS), default=list(SHEETS))
+    parser.add_argument("--out", help="JSON results file")
+    parser.add_argument("--compare", help="earlier JSON results to diff against")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = []
+    print(f"{'sheet':<8}{'rows':>8}  {'stage':<12}{'median':>12}{'min':>12}")
+    for sheet in args.sheets:
+        build, stages = SHEETS[sheet]
+        for rows in args.rows:
+            timings = time_stages(stages(build(rows)), args.repeat)
+            for stage, (median, fastest) in timings.items():
+                results.append({"sheet": sheet, "rows": rows, "stage": stage,
+                                "median_s": median, "min_s": fastest})
+                print(f"{sheet:<8}{rows:>8}  {stage:<12}{median * 1000:>10.1f}ms{fastest * 1000:>10.1f}ms")
+
+    out = args.out or os.path.join(ROOT, "benchmarks", "results", f"pipeline-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump({
+            "commit": commit,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "excel_backend": default_backend(),
+            "packages": package_versions(),
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
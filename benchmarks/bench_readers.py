@@ -0,0 +1,57 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# BENCHMARK: Excel reader backends on CellPoint sheet shapes
+# ======================================================
+#
+# python benchmarks/bench_readers.py [--repeat 5]
+#
+# Builds in-memory workbooks shaped like the real uploads (see
+# synthetic.py) and times every installed reader backend against the
+# projected read each page performs.
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import branch_workbook, staff_workbook  # noqa: E402
+from cellpoint.ingest import BRANCH_COLUMNS, STAFF_COLUMNS  # noqa: E402
+from cellpoint.readers import available_backends, read_sheet  # noqa: E402
+
+
+SHAPES = {
+    "branch": (branch_workbook, dict(columns=BRANCH_COLUMNS, stop_at="TOTAL")),
+    "staff": (staff_workbook, dict(columns=STAFF_COLUMNS, header_rows=2,
+                                   first_column="SALESMAN", stop_at="TOTAL")),
+}
+
+
+def time_read(data, backend, kwargs, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read_sheet(data, backend=backend, **kwargs)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Excel reader backends")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rows", type=int, nargs="+", default=[12, 500, 5000])
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"{'sheet':<8}{'rows':>7}  " + "".join(f"{b:>12}" for b in backends))
+    for kind, (build, kwargs) in SHAPES.items():
+        for rows in args.rows:
+            data = build(rows)
+            times = [time_read(data, b, kwargs, args.repeat) for b in backends]
+            print(f"{kind:<8}{rows:>7}  " + "".join(f"{t * 1000:>10.1f}ms" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# BENCHMARK: Synthetic CellPoint workbooks
+# ======================================================
+#
+# python benchmarks/synthetic.py OUT [--rows 40] [--dates 2026-01-31]
+#                                    [--stores "CellPoint 1" "CellPoint 2"]
+#
+# Workbooks shaped like the real uploads: the brand sheet (S.NO,
+# BRAND NAME, MONTHLY TARGET … with unused columns, a TOTAL row and
+# notes below it) and the staff sheet with its two-row HANDSET /
+# ACCESSORIES grouped header. Deterministic for a given seed, from
+# ten rows to 100k. The CLI writes the batch generator's input layout:
+# OUT/<date>/branch/<store>.xlsx and OUT/<date>/staff/<store>.xlsx.
+
+import argparse
+import random
+from datetime import date
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import Workbook
+
+BRANDS = ["IPHONE", "SAMSUNG", "VIVO", "OPPO", "REALME", "ONEPLUS", "REDMI",
+          "MOTO", "NOTHING", "POCO", "IQOO", "TECNO", "INFINIX", "GOOGLE PIXEL", "OTHERS"]
+
+FIRST_NAMES = ["ARUN", "DIVYA", "RAHUL", "SNEHA", "VIJAY", "ANJALI", "KARTHIK",
+               "MEERA", "SURESH", "PRIYA", "NITHIN", "LAKSHMI", "RAJESH", "KAVYA"]
+
+
+def brand_names(rows):
+    """Real brand names first, then model-line variants to reach rows."""
+    names = BRANDS[:rows]
+    line = 2
+    while len(names) < rows:
+        names += [f"{b} {line}" for b in BRANDS[:rows - len(names)]]
+        line += 1
+    return names
+
+
+def salesman_names(rows):
+    names = ["ADMIN"] + FIRST_NAMES[:rows - 1]
+    i = 1
+    while len(names) < rows:
+        names += [f"{n} {i}" for n in FIRST_NAMES[:rows - len(names)]]
+        i += 1
+    return names[:rows]
+
+
+def _save(wb):
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+# ======================================================
+# SHEET SHAPES
+# ======================================================
+def branch_workbook(rows, seed=0):
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["S.NO", "Brand Name", "Category", "Monthly Target", "Achievement",
+               "Balance To Do", "Daily Target", "Last Month", "Growth %", "Remarks"])
+    for i, brand in enumerate(brand_names(rows)):
+        target = rng.randrange(5, 500) * 10_000
+        ach = int(target * rng.uniform(0.1, 1.3))
+        ws.append([i + 1, brand, "HANDSET", target, ach, max(target - ach, 0),
+                   target // 30, int(ach * rng.uniform(0.7, 1.2)),
+                   round(rng.uniform(-20, 40), 1), "—"])
+    ws.append([None, "TOTAL", None, 0, 0, 0, 0, 0, None, None])
+    for i in range(max(rows // 10, 1)):
+        ws.append([None, f"note {i}", "prepared by accounts"])
+    return _save(wb)
+
+
+def staff_workbook(rows, seed=0):
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append([None, "HANDSET", None, None, "ACCESSORIES", None, None, "OTHERS", None])
+    ws.append(["SALESMAN", "TARGET", "ACHIEVEMENT", "BALANCE",
+               "TARGET", "ACHIEVEMENT", "BALANCE", "INCENTIVE", "REMARKS"])
+    for name in salesman_names(rows):
+        hs = rng.randrange(20, 120) * 10_000
+        acc = rng.randrange(10, 80) * 1_000
+        hs_ach = int(hs * rng.uniform(0.2, 1.3))
+        acc_ach = int(acc * rng.uniform(0.2, 1.3))
+        ws.append([name, hs, hs_ach, max(hs - hs_ach, 0),
+                   acc, acc_ach, max(acc - acc_ach, 0), rng.randrange(0, 5000), "—"])
+    ws.append(["TOTAL", 0, 0, 0, 0, 0, 0, 0, None])
+    return _save(wb)
+
+
+# ======================================================
+# BATCH INPUT LAYOUT
+# ======================================================
+def write_layout(out_dir, rows, dates, stores, staff_rows=None):
+    """Write branch and staff workbooks for every date × store; returns the paths."""
+    written = []
+    for d, report_date in enumerate(dates):
+        for s, store in enumerate(stores):
+            seed = d * len(stores) + s
+            for kind, data in (
+                ("branch", branch_workbook(rows, seed)),
+                ("staff", staff_workbook(staff_rows or rows, seed)),
+            ):
+                path = Path(out_dir) / report_date.isoformat() / kind / f"{store}.xlsx"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+                written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic CellPoint workbooks")
+    parser.add_argument("out")
+    parser.add_argument("--rows", type=int, default=len(BRANDS))
+    parser.add_argument("--staff-rows", type=int)
+    parser.add_argument("--dates", nargs="+", type=date.fromisoformat, default=[date.today()])
+    parser.add_argument("--stores", nargs="+", default=["CellPoint 1", "CellPoint 2"])
+    args = parser.parse_args()
+
+    written = write_layout(args.out, args.rows, args.dates, args.stores, args.staff_rows)
+    print(f"{len(written)} workbooks written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# PACKAGE: Shared core for the Streamlit pages
+# ======================================================
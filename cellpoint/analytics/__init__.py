@@ -0,0 +1,21 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# PACKAGE: Analytics (Streamlit-free)
+# ======================================================
+#
+# Plain DataFrames in, report tables and figures out. The pages only
+# render what these return; the batch generator and the benchmarks call
+# them directly.
+
+from cellpoint.ingest import clean_branch_frame, clean_staff_frame
+from cellpoint.analytics.period import month_progress, run_rate
+from cellpoint.analytics.sales import (
+    action_plan, brand_performance, company_summary, predict
+)
+from cellpoint.analytics.cellsum import (
+    MRI_TARGET_INDEX, MRI_TARGETS, cellsum_table, mri_achievement, mri_assessment,
+    mri_store_contribution, mri_summary, mri_table, store_contribution, store_universe,
+    universe_summary
+)
+from cellpoint.analytics.staff import score_staff, staff_leaders, staff_ranking, staff_roster
+from cellpoint.analytics.ranking import EXCLUDED_ROLES, STAFF_METRICS, Ranking, role_mask
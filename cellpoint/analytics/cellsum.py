@@ -0,0 +1,178 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: CELLSUM & MRI analytics
+# ======================================================
+
+import numpy as np
+import pandas as pd
+
+from cellpoint.analytics.period import run_rate
+from cellpoint.bands import MRI_STATUS, RISK_LEVEL
+from cellpoint.brands import canonical_name
+from cellpoint.compact import pct, tag_stores
+from cellpoint.ingest import BRANCH_NUMERIC_COLS
+
+# ======================================================
+# MRI PERMANENT TARGETS (₹ in Lakhs)
+# ======================================================
+MRI_TARGETS = {
+    "IPHONE": 70,
+    "REALME": 32,
+    "OPPO": 31,
+    "VIVO": 45,
+    "NOTHING": 15,
+    "REDMI": 10,
+    "MOTO": 20,
+    "OTHERS": 10,
+    "SAMSUNG": 20,
+    "ONEPLUS": 25
+}
+
+
+# Built once: upper-case brand → MRI target in ₹
+MRI_TARGET_INDEX = (
+    pd.Series(MRI_TARGETS, name="MRI TARGET", dtype="int64")
+    .mul(1_00_000)
+    .rename_axis("BRAND NAME")
+)
+
+
+# ======================================================
+# UNIVERSE & CELLSUM
+# ======================================================
+def store_universe(stores):
+    """One store-tagged frame from {store name: cleaned branch frame}."""
+    return tag_stores(stores, "BRAND NAME")
+
+
+def cellsum_table(universe):
+    cellsum_df = (
+        universe
+        .groupby("BRAND NAME", as_index=False, observed=True)[BRANCH_NUMERIC_COLS]
+        .sum()
+    )
+
+    achievement_pct = cellsum_df["ACHIEVEMENT"] / cellsum_df["MONTHLY TARGET"] * 100
+    cellsum_df["ACHIEVEMENT %"] = pct(achievement_pct)
+    cellsum_df["RISK LEVEL"] = RISK_LEVEL.classify(achievement_pct)
+
+    # BEST → WORST hierarchy (RISK LEVEL is an ordered categorical)
+    return cellsum_df.sort_values(
+        ["RISK LEVEL", "ACHIEVEMENT %"], ascending=[True, False]
+    )
+
+
+def store_contribution(universe):
+    store_df = universe.groupby("STORE", sort=False, observed=True)[["ACHIEVEMENT"]].sum()
+    universe_total = store_df["ACHIEVEMENT"].sum()
+    store_df["CONTRIBUTION %"] = (
+        pct((store_df["ACHIEVEMENT"] / universe_total) * 100) if universe_total else np.float32(0)
+    )
+    return store_df
+
+
+def universe_summary(cellsum_df, run_rate, days_remaining):
+    total_ach = cellsum_df["ACHIEVEMENT"].sum()
+    total_trgt = cellsum_df["MONTHLY TARGET"].sum()
+    return {
+        "total_ach": total_ach,
+        "total_trgt": total_trgt,
+        "total_pct": (total_ach / total_trgt) * 100,
+        "predicted_final": total_ach + run_rate * days_remaining,
+    }
+
+
+# ======================================================
+# MRI
+# ======================================================
+def mri_achievement(universe):
+    """Achievement of MRI brands by (BRAND NAME, STORE), in one grouped pass."""
+    brand = universe["BRAND NAME"]
+    if isinstance(brand.dtype, pd.CategoricalDtype):
+        brand_codes, brand_names = brand.cat.codes.to_numpy(), brand.cat.categories
+    else:
+        brand_codes, brand_names = pd.factorize(brand, use_na_sentinel=False)
+    store_codes, store_names = pd.factorize(universe["STORE"], use_na_sentinel=False)
+
+    # Resolve each distinct name once; the trailing -1 catches missing brands (code -1)
+    lookup = np.append(
+        MRI_TARGET_INDEX.index.get_indexer([canonical_name(b) for b in brand_names]), -1
+    )
+    rows = lookup[brand_codes]
+    hit = rows >= 0
+
+    # One bincount over the (MRI brand × store) grid
+    cells = rows[hit] * len(store_names) + store_codes[hit]
+    size = len(MRI_TARGET_INDEX) * len(store_names)
+    totals = np.bincount(cells, weights=universe["ACHIEVEMENT"].to_numpy()[hit], minlength=size)
+    present = np.bincount(cells, minlength=size) > 0
+
+    index = pd.MultiIndex.from_product(
+        [MRI_TARGET_INDEX.index, store_names], names=["BRAND NAME", "STORE"]
+    )
+    return pd.Series(totals, index=index, name="ACHIEVEMENT")[present]
+
+
+def _mri_brands(achievement):
+    by_brand = achievement.groupby(level="BRAND NAME", sort=False).sum()
+    mri_df = pd.DataFrame({
+        "BRAND NAME": by_brand.index,
+        "MRI TARGET": MRI_TARGET_INDEX.reindex(by_brand.index).to_numpy(),
+        "ACHIEVEMENT": by_brand.to_numpy(),
+    })
+    mri_pct = (mri_df["ACHIEVEMENT"] / mri_df["MRI TARGET"]) * 100
+    mri_df["MRI %"] = pct(mri_pct)
+    mri_df["MRI STATUS"] = MRI_STATUS.classify(mri_pct)
+
+    # BEST → WORST hierarchy (MRI STATUS is an ordered categorical)
+    return mri_df.sort_values(
+        ["MRI STATUS", "MRI %"], ascending=[True, False]
+    )
+
+
+def _mri_stores(achievement, stores):
+    mri_store_df = (
+        achievement.groupby(level="STORE", sort=False).sum()
+        .reindex(stores, fill_value=0)
+        .to_frame("ACHIEVEMENT")
+    )
+    mri_total = mri_store_df["ACHIEVEMENT"].sum()
+    mri_store_df["CONTRIBUTION %"] = (
+        pct((mri_store_df["ACHIEVEMENT"] / mri_total) * 100) if mri_total else np.float32(0)
+    )
+    return mri_store_df
+
+
+def mri_table(universe):
+    """MRI brand table (target, achieved, %, status), best → worst."""
+    return _mri_brands(mri_achievement(universe))
+
+
+def mri_store_contribution(universe, stores):
+    """MRI-brand achievement per store, in the order of stores."""
+    return _mri_stores(mri_achievement(universe), stores)
+
+
+def mri_summary(mri_df, days_completed, days_remaining):
+    mri_ach = mri_df["ACHIEVEMENT"].sum()
+    mri_trgt = mri_df["MRI TARGET"].sum()
+    mri_run = run_rate(mri_ach, days_completed)
+    mri_pred = mri_ach + mri_run * days_remaining
+    return {
+        "mri_ach": mri_ach,
+        "mri_trgt": mri_trgt,
+        "mri_run": mri_run,
+        "mri_pred": mri_pred,
+        "mri_pct": (mri_pred / mri_trgt) * 100,
+    }
+
+
+def mri_assessment(universe, stores):
+    """The day-independent MRI results: brand table, store split and carrier."""
+    achievement = mri_achievement(universe)
+    mri_store_df = _mri_stores(achievement, stores)
+    return {
+        "mri_df": _mri_brands(achievement),
+        "mri_store_df": mri_store_df,
+        "mri_carrier": mri_store_df["ACHIEVEMENT"].idxmax(),
+    }
@@ -0,0 +1,17 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Month progress & run rate
+# ======================================================
+
+import calendar
+
+
+def month_progress(report_date):
+    """(days_completed, total_days, days_remaining) as on report_date."""
+    days_completed = report_date.day
+    total_days = calendar.monthrange(report_date.year, report_date.month)[1]
+    return days_completed, total_days, total_days - days_completed
+
+
+def run_rate(achievement, days_completed):
+    return achievement / days_completed if days_completed > 0 else 0
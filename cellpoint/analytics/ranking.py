@@ -0,0 +1,98 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Multi-metric ranking (employee leaderboard)
+# ======================================================
+#
+# Every metric is ordered best → worst in one argsort over the metric
+# matrix. Leaders and tail risks come from partial selection, and
+# excluded roles (ADMIN) are a row mask rather than a positional skip.
+# Ties keep sheet order and a missing % (no target) ranks last, as with
+# a stable sort_values.
+
+import numpy as np
+import pandas as pd
+
+STAFF_METRICS = ["HS_%", "ACC_%", "OVERALL_%"]
+
+# Shown in the tables but never reported as a leader or risk
+EXCLUDED_ROLES = ("ADMIN",)
+
+
+def role_mask(names, roles=EXCLUDED_ROLES):
+    """True where the name is one of roles (case and spaces ignored)."""
+    names = pd.Series(names)
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Once per category; the trailing False covers missing names (code -1)
+        hit = names.cat.categories.astype(str).str.strip().str.upper().isin(roles)
+        return np.append(hit, False)[names.cat.codes.to_numpy()]
+    return names.astype(str).str.strip().str.upper().isin(roles).to_numpy()
+
+
+def _select(key, k):
+    """Positions of the k smallest keys in order, ties by position, in O(n)."""
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    if k >= len(key):
+        return np.lexsort((np.arange(len(key)), key))
+    kth = np.partition(key, k - 1)[k - 1]
+    below = np.flatnonzero(key < kth)
+    picked = np.concatenate([below, np.flatnonzero(key == kth)[:k - len(below)]])
+    return picked[np.lexsort((picked, key[picked]))]
+
+
+class Ranking:
+    """Best → worst order of each metric of df, from one vectorized pass.
+
+    where (a boolean row mask) narrows any query to part of df, e.g. one
+    store of a chain-wide roster, reusing the same order.
+    """
+
+    def __init__(self, df, metrics=STAFF_METRICS, excluded=None):
+        self.df = df
+        self.metrics = list(metrics)
+        self.values = df[self.metrics].to_numpy(dtype="float64")
+        # -NaN is NaN, which argsort places last
+        self.order = np.argsort(-self.values, axis=0, kind="stable")
+        self.excluded = (
+            np.zeros(len(df), dtype=bool) if excluded is None else np.asarray(excluded)
+        )
+
+    def _column(self, metric):
+        return self.metrics.index(metric)
+
+    def ranked(self, metric, where=None):
+        """The frame (or its where rows), best → worst on metric."""
+        order = self.order[:, self._column(metric)]
+        if where is not None:
+            # A subset of a sorted order is still sorted: no re-rank
+            order = order[where[order]]
+        return self.df.iloc[order]
+
+    def _pick(self, metric, k, best, include_excluded, where):
+        values = self.values[:, self._column(metric)]
+        keep = ~np.isnan(values)
+        if not include_excluded:
+            keep &= ~self.excluded
+        if where is not None:
+            keep &= where
+        rows = np.flatnonzero(keep)
+        key = -values[rows] if best else values[rows]
+        return self.df.iloc[rows[_select(key, k)]]
+
+    def top(self, metric, k=1, include_excluded=False, where=None):
+        return self._pick(metric, k, True, include_excluded, where)
+
+    def bottom(self, metric, k=1, include_excluded=False, where=None):
+        return self._pick(metric, k, False, include_excluded, where)
+
+    def leader(self, metric, include_excluded=False, where=None):
+        """Best row on metric; the overall best if every row is excluded."""
+        top = self.top(metric, 1, include_excluded, where)
+        if top.empty:
+            return self.ranked(metric, where).iloc[0]
+        return top.iloc[0]
+
+    def risk(self, metric, where=None):
+        """Worst non-excluded row with a value on metric, or None."""
+        bottom = self.bottom(metric, 1, where=where)
+        return None if bottom.empty else bottom.iloc[0]
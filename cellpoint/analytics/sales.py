@@ -0,0 +1,77 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Sales analytics (branch report)
+# ======================================================
+
+import numpy as np
+import pandas as pd
+
+from cellpoint.bands import COMPANY_STATUS, DIFFICULTY, RISK_LEVEL
+from cellpoint.compact import pct
+
+
+# ======================================================
+# BRAND PERFORMANCE (EXCELLENT → CRITICAL)
+# ======================================================
+def brand_performance(df):
+    df = df.copy()
+    achievement_pct = (df["ACHIEVEMENT"] / df["MONTHLY TARGET"]) * 100
+    df["ACHIEVEMENT %"] = pct(achievement_pct)
+    df["RISK LEVEL"] = RISK_LEVEL.classify(achievement_pct)
+    return df.sort_values(by="ACHIEVEMENT %", ascending=False)
+
+
+# ======================================================
+# COMPANY METRICS
+# ======================================================
+def company_summary(df):
+    """Company totals for a brand_performance frame; top_risk is its last row."""
+    company_ach = df["ACHIEVEMENT"].sum()
+    company_trgt = df["MONTHLY TARGET"].sum()
+    company_pct = (company_ach / company_trgt) * 100
+    return {
+        "company_ach": company_ach,
+        "company_trgt": company_trgt,
+        "company_pct": company_pct,
+        "status_text": COMPANY_STATUS.label(company_pct),
+        "top_risk": df.iloc[-1],
+    }
+
+
+# ======================================================
+# PREDICTION (LINEAR VELOCITY)
+# ======================================================
+def predict(company_ach, company_trgt, daily_rate, days_remaining):
+    predicted_final = company_ach + daily_rate * days_remaining
+    predicted_pct = (predicted_final / company_trgt) * 100
+    return {
+        "predicted_final": predicted_final,
+        "predicted_pct": predicted_pct,
+        "predicted_text": f"{COMPANY_STATUS.label(predicted_pct)} ({predicted_pct:.1f}%)",
+    }
+
+
+# ======================================================
+# ACTION PLAN (WHAT TO DO NEXT)
+# ======================================================
+def action_plan(df, days_remaining):
+    btd = df["BALANCE TO DO"].to_numpy(dtype="float64")
+    daily = df["DAILY TARGET"].to_numpy(dtype="float64")
+
+    if days_remaining == 0:
+        req_day = np.zeros(len(df))
+        difficulty = np.full(len(df), "⏹ Month Closed", dtype=object)
+    else:
+        req_day = btd / days_remaining
+        # No daily target → nothing extra required, counts as easy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(daily > 0, req_day / daily, 0)
+        difficulty = np.asarray(DIFFICULTY.classify(ratio), dtype=object)
+
+    return pd.DataFrame({
+        "Brand": df["BRAND NAME"].to_numpy(),
+        "BALANCE TO DO": btd.astype("int64"),
+        "Required / Day": req_day.astype("int64"),
+        "Normal Daily": daily.astype("int64"),
+        "Difficulty": difficulty
+    })
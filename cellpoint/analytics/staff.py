@@ -0,0 +1,87 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Staff analytics (employee report)
+# ======================================================
+
+from cellpoint.analytics.ranking import STAFF_METRICS, Ranking, role_mask
+from cellpoint.bands import STAFF_STATUS
+from cellpoint.compact import pct, tag_stores, widen
+
+
+def score_staff(df):
+    """Handset, accessories and overall % with their status bands."""
+    df = df.copy()
+    hs_pct = (df["HS_ACH"] / df["HS_TARGET"]) * 100
+    acc_pct = (df["ACC_ACH"] / df["ACC_TARGET"]) * 100
+    df["HS_%"] = pct(hs_pct)
+    df["ACC_%"] = pct(acc_pct)
+
+    # Bands read the float64 values; only the stored % is float32
+    df["HS_STATUS"] = STAFF_STATUS.classify(hs_pct)
+    df["ACC_STATUS"] = STAFF_STATUS.classify(acc_pct)
+
+    # Widen before adding: int32 ingest columns would overflow silently
+    for total, hs, acc in [("TOTAL_TARGET", "HS_TARGET", "ACC_TARGET"),
+                           ("TOTAL_ACH", "HS_ACH", "ACC_ACH"),
+                           ("TOTAL_BAL", "HS_BAL", "ACC_BAL")]:
+        df[total] = widen(df[hs]) + df[acc]
+    overall_pct = (df["TOTAL_ACH"] / df["TOTAL_TARGET"]) * 100
+    df["OVERALL_%"] = pct(overall_pct)
+    df["FINAL_STATUS"] = STAFF_STATUS.classify(overall_pct)
+    return df
+
+
+def staff_roster(stores):
+    """One store-tagged staff frame from {store name: cleaned staff frame}."""
+    return tag_stores(stores, "SALESMAN")
+
+
+def _is_admin(row):
+    return str(row["SALESMAN"]).strip().upper() == "ADMIN"
+
+
+# Metric → label used when ADMIN tops it
+_LEADER_BOARDS = {
+    "OVERALL_%": "Overall",
+    "HS_%": "Handset",
+    "ACC_%": "Accessories",
+}
+
+
+def staff_ranking(df):
+    """Ranking of a score_staff frame with ADMIN masked out of the leaders."""
+    return Ranking(df, STAFF_METRICS, excluded=role_mask(df["SALESMAN"]))
+
+
+def staff_leaders(df, ranking=None, store=None):
+    """Hierarchies, leaders and team figures for a score_staff frame.
+
+    For a staff_roster frame, store narrows everything to that store;
+    pass the roster's ranking so each view reuses it.
+    """
+    if ranking is None:
+        ranking = staff_ranking(df)
+    where = None if store is None else (df["STORE"] == store).to_numpy()
+
+    # ADMIN OVERRIDE (DISPLAY ONLY): ADMIN stays in the tables but the
+    # leader shown is the best non-ADMIN row
+    admin_msgs = []
+    for metric, board in _LEADER_BOARDS.items():
+        if _is_admin(ranking.leader(metric, include_excluded=True, where=where)):
+            admin_msgs.append(f"📌 As per the report, Admin is the {board} Top Performer.")
+
+    team = df if where is None else df[where]
+    team_avg_pct = team["OVERALL_%"].astype("float64").mean()
+    return {
+        "ranking": ranking,
+        "df_handset": ranking.ranked("HS_%", where),
+        "df_accessory": ranking.ranked("ACC_%", where),
+        "df_combined": ranking.ranked("OVERALL_%", where),
+        "effective_top": ranking.leader("OVERALL_%", where=where),
+        "effective_top_handset": ranking.leader("HS_%", where=where),
+        "effective_top_accessory": ranking.leader("ACC_%", where=where),
+        "risk_accessory": ranking.risk("ACC_%", where=where),
+        "admin_msgs": admin_msgs,
+        "team_avg_pct": team_avg_pct,
+        "team_status": STAFF_STATUS.label(team_avg_pct),
+    }
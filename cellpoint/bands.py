@@ -0,0 +1,105 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Declarative status / risk banding
+# ======================================================
+#
+# Every page used to classify percentages with its own if/elif
+# function applied row by row. A Banding lists its bands best-first;
+# the first band whose condition holds wins, exactly like the old
+# if/elif chains, and the last band is the fallback (NaN lands there).
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+Band = namedtuple("Band", "label color op threshold")
+
+_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
+
+class Banding:
+
+    def __init__(self, bands):
+        self.bands = [Band(*b) for b in bands]
+        self.labels = [b.label for b in self.bands]
+        self.colors = {b.label: b.color for b in self.bands}
+        self.dtype = pd.CategoricalDtype(self.labels, ordered=True)
+
+    def codes(self, values):
+        """Band index per value, 0 being the best band."""
+        values = np.asarray(values, dtype="float64")
+        conditions = [_OPS[b.op](values, b.threshold) for b in self.bands[:-1]]
+        return np.select(conditions, range(len(conditions)), default=len(self.bands) - 1)
+
+    def classify(self, values):
+        """Ordered categorical of band labels; sorting it sorts best → worst."""
+        cat = pd.Categorical.from_codes(self.codes(values), dtype=self.dtype)
+        if isinstance(values, pd.Series):
+            return pd.Series(cat, index=values.index, name=values.name)
+        return cat
+
+    def rank(self, values):
+        """1-based rank of each value's band (1 = best)."""
+        return self.codes(values) + 1
+
+    def label(self, value):
+        """Band label for a single number."""
+        return self.labels[int(self.codes([value])[0])]
+
+    def color(self, label):
+        return self.colors.get(label, "black")
+
+
+# ======================================================
+# BANDS USED BY THE PAGES
+# ======================================================
+ORANGE = "orange"
+DARK_ORANGE = "#d35400"
+
+# Brand achievement % (sales + CELLSUM)
+RISK_LEVEL = Banding([
+    ("🟢 Extra Ordinary", "green", ">", 100),
+    ("🟢 Excellent", "green", ">=", 91),
+    ("🟡 Good", ORANGE, ">=", 61),
+    ("🟠 Average", DARK_ORANGE, ">=", 31),
+    ("🔴 Very High", "red", None, None),
+])
+
+# Whole-company achievement % (sales + CELLSUM)
+COMPANY_STATUS = Banding([
+    ("🟢 EXTRA ORDINARY", "green", ">", 100),
+    ("🟢 EXCELLENT", "green", ">=", 91),
+    ("🟡 GOOD", ORANGE, ">=", 61),
+    ("🟠 AVERAGE", DARK_ORANGE, ">=", 31),
+    ("🔴 CRITICAL", "red", None, None),
+])
+
+# MRI brand-mix alignment %
+MRI_STATUS = Banding([
+    ("🟢 Aligned", "green", ">=", 100),
+    ("🟡 Slight Gap", ORANGE, ">=", 85),
+    ("🟠 Misaligned", DARK_ORANGE, ">=", 70),
+    ("🔴 High Risk", "red", None, None),
+])
+
+# Salesman HS / ACC / overall %
+STAFF_STATUS = Banding([
+    ("🟢 Top performer, role model", "green", ">=", 91),
+    ("🟡 Performing well, push to excellent", ORANGE, ">=", 61),
+    ("🟠 Need strong improvement", DARK_ORANGE, ">=", 31),
+    ("🔴 Immediate correction required", "red", None, None),
+])
+
+# Required-per-day vs normal daily target (sales action plan)
+DIFFICULTY = Banding([
+    ("🟢 Easy", "green", "<=", 1),
+    ("🟡 Stretch", ORANGE, "<=", 1.2),
+    ("🟠 Hard", DARK_ORANGE, "<=", 1.5),
+    ("🔴 Almost Impossible", "red", None, None),
+])
@@ -0,0 +1,266 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Headless batch report generator
+# ======================================================
+#
+# Renders the Morning Sales, EMP Intelligence and CELLSUM/MRI PDFs for
+# a whole store × date matrix without Streamlit:
+#
+#   python -m cellpoint.batch --input uploads --out reports \
+#       --dates 2026-01-30 2026-01-31 --stores "CellPoint 1" "CellPoint 2"
+#
+# Input layout (one workbook per store, named after the store):
+#
+#   <input>/<YYYY-MM-DD>/branch/<store>.xlsx   sales + CELLSUM
+#   <input>/<YYYY-MM-DD>/staff/<store>.xlsx    employee
+#
+# Every report is one job on a process pool; PDFs land in
+# <out>/<YYYY-MM-DD>/[<store>/] under the page download names.
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+
+from cellpoint.analytics import (
+    action_plan, brand_performance, cellsum_table, company_summary, month_progress,
+    mri_summary, mri_table, predict, run_rate, score_staff, staff_leaders,
+    store_contribution, store_universe, universe_summary
+)
+from cellpoint.ingest import load_branch_excel, load_staff_excel
+
+log = logging.getLogger(__name__)
+
+REPORTS = ("sales", "employee", "cellsum")
+
+# Workbook folder each report reads from
+SOURCES = {"sales": "branch", "employee": "staff", "cellsum": "branch"}
+
+
+# ======================================================
+# REPORT JOBS (run in worker processes)
+# ======================================================
+def sales_report(path, store, report_date):
+    from cellpoint.pdf import generate_complete_pdf
+
+    days_completed, total_days, days_remaining = month_progress(report_date)
+
+    df = brand_performance(load_branch_excel(path))
+    summary = company_summary(df)
+    action_df = action_plan(df, days_remaining)
+
+    # Same figure as the month-to-date ledger's store run rate
+    prediction = predict(
+        summary["company_ach"],
+        summary["company_trgt"],
+        run_rate(summary["company_ach"], days_completed),
+        days_remaining
+    )
+
+    return generate_complete_pdf(
+        df,
+        summary["status_text"],
+        summary["company_pct"],
+        summary["top_risk"],
+        prediction["predicted_text"],
+        summary["company_ach"],
+        prediction["predicted_final"],
+        summary["company_trgt"],
+        action_df,
+        store,
+        report_date,
+        days_completed,
+        days_remaining,
+        total_days
+    )
+
+
+def employee_report(path, store, report_date):
+    from cellpoint.pdf import generate_employee_pdf
+
+    df = score_staff(load_staff_excel(path))
+    leaders = staff_leaders(df)
+
+    return generate_employee_pdf(
+        df,
+        leaders["df_handset"],
+        leaders["df_accessory"],
+        leaders["df_combined"],
+        leaders["effective_top"],
+        leaders["effective_top_handset"],
+        leaders["effective_top_accessory"],
+        leaders["risk_accessory"],
+        leaders["team_avg_pct"],
+        leaders["team_status"],
+        store,
+        report_date
+    )
+
+
+def cellsum_report(paths, report_date):
+    from cellpoint.pdf import generate_cellsum_mri_pdf
+
+    days_completed, total_days, days_remaining = month_progress(report_date)
+
+    universe = store_universe({store: load_branch_excel(p) for store, p in paths.items()})
+    cellsum_df = cellsum_table(universe)
+
+    universe_rate = run_rate(cellsum_df["ACHIEVEMENT"].sum(), days_completed)
+    summary = universe_summary(cellsum_df, universe_rate, days_remaining)
+    cellsum_carrier = store_contribution(universe)["ACHIEVEMENT"].idxmax()
+
+    mri_df = mri_table(universe)
+    mri = mri_summary(mri_df, days_completed, days_remaining)
+
+    return generate_cellsum_mri_pdf(
+        cellsum_df,
+        summary["total_trgt"],
+        summary["total_ach"],
+        summary["total_pct"],
+        universe_rate,
+        summary["predicted_final"],
+        cellsum_carrier,
+        mri_df,
+        mri["mri_pct"]
+    )
+
+
+def _render(job):
+    """Build one report and write it; returns (output path, seconds)."""
+    report, source, report_date, out = job
+    started = time.perf_counter()
+
+    if report == "sales":
+        buffer = sales_report(source[1], source[0], report_date)
+    elif report == "employee":
+        buffer = employee_report(source[1], source[0], report_date)
+    else:
+        buffer = cellsum_report(source, report_date)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(buffer.getvalue())
+    os.replace(tmp, out)
+    return out, time.perf_counter() - started
+
+
+# ======================================================
+# JOB MATRIX
+# ======================================================
+def output_path(out_dir, report, report_date, store=None):
+    """Where a report lands; file names match the page downloads."""
+    day_dir = Path(out_dir) / report_date.isoformat()
+    if report == "sales":
+        return day_dir / store / "CELLPOINT_Full_Morning_Sales_Report.pdf"
+    if report == "employee":
+        return day_dir / store / f"EMPINTELLIGENCE_MARK1_{store}_{report_date}.pdf"
+    return day_dir / "CELLPOINT_CELLSUM_MRI_Report.pdf"
+
+
+def input_dates(input_dir):
+    dates = []
+    for entry in Path(input_dir).iterdir():
+        try:
+            dates.append(date.fromisoformat(entry.name))
+        except ValueError:
+            continue
+    return sorted(dates)
+
+
+def workbooks(input_dir, report_date, kind, stores=None):
+    """{store: path} for one date and workbook folder, filtered to stores."""
+    folder = Path(input_dir) / report_date.isoformat() / kind
+    if not folder.is_dir():
+        return {}
+    found = {p.stem: p for p in sorted(folder.glob("*.xlsx")) if not p.name.startswith("~$")}
+    if stores:
+        found = {name: found[name] for name in stores if name in found}
+    return found
+
+
+def plan_jobs(input_dir, out_dir, dates=None, stores=None, reports=REPORTS):
+    """Every (report, source, date, output) job for the store × date matrix."""
+    jobs = []
+    for report_date in dates or input_dates(input_dir):
+        for report in reports:
+            found = workbooks(input_dir, report_date, SOURCES[report], stores)
+            if not found:
+                log.warning("No %s workbooks for %s on %s", SOURCES[report], report, report_date)
+            elif report == "cellsum":
+                jobs.append((report, found, report_date, output_path(out_dir, report, report_date)))
+            else:
+                for store, path in found.items():
+                    out = output_path(out_dir, report, report_date, store)
+                    jobs.append((report, (store, path), report_date, out))
+    return jobs
+
+
+def run(jobs, workers=None, on_done=None):
+    """Render jobs across a process pool; returns (written, errors)."""
+    written, errors = [], {}
+    if not jobs:
+        return written, errors
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    ctx = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {pool.submit(_render, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                out, seconds = future.result()
+            except Exception as exc:
+                errors[job[3]] = exc
+                log.error("Failed %s for %s: %s", job[0], job[2], exc)
+                continue
+            written.append(out)
+            if on_done:
+                on_done(out, seconds)
+    return written, errors
+
+
+# ======================================================
+# CLI
+# ======================================================
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m cellpoint.batch",
+        description="Render CELLPOINT PDF reports for a store × date matrix."
+    )
+    parser.add_argument("--input", required=True,
+                        help="folder holding <YYYY-MM-DD>/branch and <YYYY-MM-DD>/staff workbooks")
+    parser.add_argument("--out", required=True, help="folder the PDFs are written to")
+    parser.add_argument("--dates", nargs="+", type=date.fromisoformat,
+                        help="report dates (default: every dated folder in --input)")
+    parser.add_argument("--stores", nargs="+", help="store names (default: every workbook found)")
+    parser.add_argument("--reports", nargs="+", choices=REPORTS, default=list(REPORTS))
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    jobs = plan_jobs(args.input, args.out, args.dates, args.stores, args.reports)
+    started = time.perf_counter()
+    written, errors = run(
+        jobs, args.workers,
+        on_done=lambda out, seconds: print(f"✅ {out} ({seconds:.1f}s)")
+    )
+
+    print(
+        f"{len(written)} of {len(jobs)} reports written to {args.out} "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
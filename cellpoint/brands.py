@@ -0,0 +1,98 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Canonical brand registry
+# ======================================================
+#
+# Store exports spell brands differently ("I PHONE", "Apple", "One
+# Plus"). Every spelling is resolved here, once per distinct value, to
+# one canonical name, and BRAND NAME is stored as a Categorical whose
+# categories start with the registry in a fixed order. Brands outside
+# the registry keep their (tidied) spelling as extra categories, so
+# nothing drops out of CELLSUM.
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Fixed category order: registry first, OTHERS last
+CANONICAL_BRANDS = [
+    "IPHONE",
+    "SAMSUNG",
+    "VIVO",
+    "OPPO",
+    "REALME",
+    "ONEPLUS",
+    "REDMI",
+    "MOTO",
+    "NOTHING",
+    "POCO",
+    "IQOO",
+    "GOOGLE PIXEL",
+    "TECNO",
+    "INFINIX",
+    "OTHERS",
+]
+
+# Spellings seen in store exports → canonical name. Lookups use
+# brand_key(), so case, spaces and punctuation never matter here.
+BRAND_ALIASES = {
+    "APPLE": "IPHONE",
+    "APPLE IPHONE": "IPHONE",
+    "I PHONE": "IPHONE",
+    "SAMSUNG GALAXY": "SAMSUNG",
+    "GALAXY": "SAMSUNG",
+    "ONE PLUS": "ONEPLUS",
+    "1+": "ONEPLUS",
+    "REAL ME": "REALME",
+    "MI": "REDMI",
+    "XIAOMI": "REDMI",
+    "REDMI MI": "REDMI",
+    "MOTOROLA": "MOTO",
+    "NOTHING PHONE": "NOTHING",
+    "I QOO": "IQOO",
+    "PIXEL": "GOOGLE PIXEL",
+    "GOOGLE": "GOOGLE PIXEL",
+    "OTHER": "OTHERS",
+    "MISC": "OTHERS",
+}
+
+_NOT_KEY = re.compile(r"[^A-Z0-9+]")
+
+
+def brand_key(name):
+    """Match key for a spelling: upper-case, letters/digits/+ only."""
+    return _NOT_KEY.sub("", str(name).upper())
+
+
+def tidy(name):
+    """Display form for a brand outside the registry."""
+    return " ".join(str(name).upper().split())
+
+
+# Built once: match key → canonical name
+_REGISTRY = {brand_key(b): b for b in CANONICAL_BRANDS}
+_REGISTRY.update({brand_key(alias): b for alias, b in BRAND_ALIASES.items()})
+
+
+def canonical_name(name):
+    return _REGISTRY.get(brand_key(name), tidy(name))
+
+
+def canonical_brands(values):
+    """BRAND NAME values as a Categorical Series of canonical names."""
+    values = pd.Series(values)
+    codes, spellings = pd.factorize(values)
+    names = [canonical_name(s) for s in spellings]
+
+    extra = sorted(set(names) - set(CANONICAL_BRANDS))
+    categories = CANONICAL_BRANDS + extra
+    position = {b: i for i, b in enumerate(categories)}
+    # Trailing -1 keeps missing names (factorize code -1) missing
+    mapped = np.array([position[n] for n in names] + [-1], dtype="int32")
+
+    return pd.Series(
+        pd.Categorical.from_codes(mapped[codes], categories=categories),
+        index=values.index,
+        name=values.name,
+    )
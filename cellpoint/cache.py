@@ -0,0 +1,102 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: In-process caches shared by every session
+# ======================================================
+
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+def digest(data):
+    """Content hash used as the cache key for uploads and reports."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def sizeof(value):
+    """Approximate memory held by a cached value, in bytes."""
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by entry count, age and total size.
+
+    Streamlit runs every browser session on its own thread inside one
+    process, so a module-level instance is shared by all users.
+    """
+
+    def __init__(self, max_entries=32, ttl=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            value, size, stamp = item
+            if self.ttl is not None and time.monotonic() - stamp > self.ttl:
+                self._drop(key)
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        size = sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+            # A single value larger than the whole budget is never stored
+            if self.max_bytes is not None and size > self.max_bytes:
+                return value
+            self._items[key] = (value, size, time.monotonic())
+            self._bytes += size
+            self._evict()
+        return value
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, size, _ = self._items.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        while len(self._items) > self.max_entries:
+            self._drop(next(iter(self._items)))
+        while self.max_bytes is not None and self._bytes > self.max_bytes:
+            self._drop(next(iter(self._items)))
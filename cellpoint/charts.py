@@ -0,0 +1,89 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Memoized chart rendering (PNG bytes)
+# ======================================================
+#
+# Charts are drawn on the Agg canvas (no pyplot, no GUI backend) into
+# one reusable Figure per chart kind and kept as PNG bytes keyed by the
+# exact plotted values and figure parameters. An unchanged chart is a
+# dictionary lookup; matplotlib is not touched.
+
+import threading
+from io import BytesIO
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from cellpoint.cache import LRUCache
+
+_charts = LRUCache(max_entries=128, ttl=6 * 60 * 60, max_bytes=32 * 1024 * 1024)
+
+_figures = {}
+_figures_lock = threading.Lock()
+
+
+def _figure(kind, figsize):
+    """The shared (figure, lock) for a chart kind and size."""
+    with _figures_lock:
+        if (kind, figsize) not in _figures:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            _figures[(kind, figsize)] = (fig, threading.Lock())
+        return _figures[(kind, figsize)]
+
+
+def _render(kind, figsize, dpi, draw, tight=False):
+    fig, lock = _figure(kind, figsize)
+    buf = BytesIO()
+    with lock:
+        fig.clear()
+        draw(fig.add_subplot())
+        if tight:
+            fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+        else:
+            fig.tight_layout()
+            fig.savefig(buf, format="png", dpi=dpi)
+        fig.clear()
+    return buf.getvalue()
+
+
+def cached_chart(key, kind, figsize, dpi, draw, tight=False):
+    """PNG bytes for key, drawing only on a cache miss."""
+    return _charts.get_or_compute(
+        (kind, figsize, dpi, tight) + key,
+        lambda: _render(kind, figsize, dpi, draw, tight)
+    )
+
+
+def clear():
+    _charts.clear()
+
+
+def _values(*values):
+    # numpy scalars and ints hash alike once they are plain floats
+    return tuple(float(v) for v in values)
+
+
+# ======================================================
+# SALES – PREDICTION GRAPH (PDF)
+# ======================================================
+def prediction_png(company_ach, predicted_final, company_trgt, days_completed, total_days,
+                   figsize=(7, 3), dpi=200):
+    def draw(ax):
+        ax.plot([0, days_completed], [0, company_ach], label="Actual", linewidth=2)
+        ax.plot(
+            [days_completed, total_days],
+            [company_ach, predicted_final],
+            linestyle="--",
+            label="Predicted",
+            linewidth=2
+        )
+        ax.axhline(company_trgt, linestyle=":", label="Monthly Target")
+
+        ax.set_xlabel("Day")
+        ax.set_ylabel("Cumulative Sales")
+        ax.set_title("Actual vs Predicted Business Performance")
+        ax.legend()
+
+    key = _values(company_ach, predicted_final, company_trgt, days_completed, total_days)
+    return cached_chart(key, "prediction", figsize, dpi, draw)
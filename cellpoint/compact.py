@@ -0,0 +1,89 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Compact dtypes for ingested frames
+# ======================================================
+#
+# Excel hands every figure over as float64 and every name as a Python
+# string. Whole-rupee columns fit int32 (up to ₹214 crore a row), names
+# repeat across rows and months, and a percentage needs no more than
+# float32 – so that is what ingested and derived frames are stored as.
+
+import logging
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+log = logging.getLogger(__name__)
+
+INT32 = np.iinfo("int32")
+
+
+def nbytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def money(series):
+    """Whole, finite rupee values as int32; anything else unchanged."""
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        if not np.isfinite(values).all() or not (values == np.trunc(values)).all():
+            return series
+    elif values.dtype.kind not in "iu":
+        return series
+    if len(values) and (values.min() < INT32.min or values.max() > INT32.max):
+        return series
+    return series.astype("int32")
+
+
+def widen(series):
+    """int64 copy of an integer column before adding columns together."""
+    return series.astype("int64") if series.dtype.kind in "iu" else series
+
+
+def pct(values):
+    """Percentage column for storage (classify on the float64 first)."""
+    return np.asarray(values, dtype="float32")
+
+
+def unify_categories(frames, column):
+    """Give every frame's column the same categories, so concat keeps the dtype."""
+    columns = [f[column] for f in frames]
+    if not all(isinstance(c.dtype, pd.CategoricalDtype) for c in columns):
+        return frames
+    categories = union_categoricals(columns).categories
+    return [f.assign(**{column: f[column].cat.set_categories(categories)}) for f in frames]
+
+
+def tag_stores(stores, column):
+    """One frame from {store name: frame}, with a categorical STORE column.
+
+    column (e.g. BRAND NAME) stays categorical across the stores, and
+    STORE categories keep upload order, so grouping by STORE does too.
+    """
+    stores = dict(zip(stores, unify_categories(list(stores.values()), column)))
+    tagged = (
+        pd.concat(stores, names=["STORE", None])
+        .reset_index(level="STORE")
+        .reset_index(drop=True)
+    )
+    tagged["STORE"] = pd.Categorical(tagged["STORE"], categories=list(stores))
+    return tagged
+
+
+def compact_frame(df, label, money_cols=(), text_cols=()):
+    """Downcast money_cols and categorize text_cols in place; logs the saving."""
+    before = nbytes(df)
+    for col in money_cols:
+        df[col] = money(df[col])
+    for col in text_cols:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    after = nbytes(df)
+
+    log.info(
+        "%s frame: %d rows, %.1f KB → %.1f KB (%.0f%% saved)",
+        label, len(df), before / 1024, after / 1024,
+        (1 - after / before) * 100 if before else 0.0
+    )
+    return df
@@ -0,0 +1,136 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Local columnar history of daily uploads
+# ======================================================
+#
+# Every cleaned upload is kept as an Arrow IPC (Feather v2) file,
+# partitioned by page, store and report date:
+#
+#   <root>/page=sales/store=CellPoint 1/date=2026-10-17/data.arrow
+#
+# Files are written uncompressed so they can be memory-mapped back
+# without re-parsing any Excel. The root defaults to
+# ~/.cellpoint/history and can be moved with CELLPOINT_HISTORY_DIR.
+# pyarrow is imported only once a partition is actually read or written.
+
+import logging
+import os
+from datetime import date
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+log = logging.getLogger(__name__)
+
+FILE_NAME = "data.arrow"
+
+
+def history_root():
+    return Path(os.environ.get("CELLPOINT_HISTORY_DIR", Path.home() / ".cellpoint" / "history"))
+
+
+def _day(report_date):
+    return report_date if isinstance(report_date, str) else report_date.isoformat()
+
+
+def partition_path(page, store, report_date, root=None):
+    root = Path(root) if root is not None else history_root()
+    return (
+        root
+        / f"page={page}"
+        / f"store={quote(str(store), safe=' ')}"
+        / f"date={_day(report_date)}"
+        / FILE_NAME
+    )
+
+
+# ======================================================
+# WRITE
+# ======================================================
+def save(df, page, store, report_date, digest=None, root=None, replace=False):
+    """Persist df for (page, store, date); returns True when written.
+
+    digest is the upload hash, checked against the one on disk: the
+    same upload is not written twice, and a partition holding a
+    different upload is kept unless replace=True, which the pages pass
+    only once the user has confirmed. A failed write is logged rather
+    than breaking the page.
+    """
+    path = partition_path(page, store, report_date, root)
+    if digest is not None and not replace:
+        current = saved_digest(page, store, report_date, root)
+        if current == digest:
+            return False
+        if current is not None:
+            log.warning("Not replacing %s: it holds a different upload", path)
+            return False
+
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        b"cellpoint.digest": (digest or "").encode(),
+    })
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.warning("Could not save history partition %s: %s", path, exc)
+        return False
+
+    return True
+
+
+# ======================================================
+# READ
+# ======================================================
+def _open(path):
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(str(path), "r"))
+
+
+def exists(page, store, report_date, root=None):
+    return partition_path(page, store, report_date, root).is_file()
+
+
+def load(page, store, report_date, root=None):
+    """Stored frame for (page, store, date), or None if never uploaded."""
+    path = partition_path(page, store, report_date, root)
+    if not path.is_file():
+        return None
+    return _open(path).read_all().to_pandas()
+
+
+def saved_digest(page, store, report_date, root=None):
+    """Upload hash recorded with a partition (reads only the schema)."""
+    path = partition_path(page, store, report_date, root)
+    if not path.is_file():
+        return None
+    metadata = _open(path).schema.metadata or {}
+    return metadata.get(b"cellpoint.digest", b"").decode() or None
+
+
+def stores(page, report_date, root=None):
+    """Stores with a saved upload for page on report_date."""
+    root = Path(root) if root is not None else history_root()
+    found = []
+    for store_dir in sorted((root / f"page={page}").glob("store=*")):
+        if (store_dir / f"date={_day(report_date)}" / FILE_NAME).is_file():
+            found.append(unquote(store_dir.name[len("store="):]))
+    return found
+
+
+def dates(page, store, root=None):
+    """Report dates saved for (page, store), oldest first."""
+    store_dir = partition_path(page, store, "x", root).parent.parent
+    return sorted(
+        date.fromisoformat(d.name[len("date="):])
+        for d in store_dir.glob("date=*")
+        if (d / FILE_NAME).is_file()
+    )
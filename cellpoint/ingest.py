@@ -0,0 +1,232 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Excel ingestion shared by sales, employee and cellsum
+# ======================================================
+#
+# Every widget touch reruns the page script. Parsing the same
+# workbook through openpyxl on each rerun dominated the page time,
+# so cleaned frames are memoized on a hash of the uploaded bytes.
+
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pandas as pd
+
+from cellpoint.brands import canonical_brands
+from cellpoint.cache import LRUCache, digest
+from cellpoint.compact import compact_frame
+from cellpoint.readers import read_sheet
+
+BRANCH_NUMERIC_COLS = ["MONTHLY TARGET", "ACHIEVEMENT", "BALANCE TO DO", "DAILY TARGET"]
+BRANCH_COLUMNS = ["BRAND NAME"] + BRANCH_NUMERIC_COLS
+
+STAFF_COLUMN_NAMES = {
+    "HANDSET_TARGET": "HS_TARGET",
+    "HANDSET_ACHIEVEMENT": "HS_ACH",
+    "HANDSET_BALANCE": "HS_BAL",
+    "ACCESSORIES_TARGET": "ACC_TARGET",
+    "ACCESSORIES_ACHIEVEMENT": "ACC_ACH",
+    "ACCESSORIES_BALANCE": "ACC_BAL"
+}
+STAFF_COLUMNS = list(STAFF_COLUMN_NAMES)
+
+# 32 workbooks, 6 hours, 256 MB of cleaned frames across all sessions
+_frames = LRUCache(max_entries=32, ttl=6 * 60 * 60, max_bytes=256 * 1024 * 1024)
+
+
+# ======================================================
+# UPLOAD HELPERS
+# ======================================================
+def upload_bytes(file):
+    """Raw bytes of a Streamlit UploadedFile, a path or a bytes object."""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    with open(file, "rb") as fh:
+        return fh.read()
+
+
+def upload_digest(file):
+    return digest(upload_bytes(file))
+
+
+def store_name(file):
+    """Store label for an upload, taken from its file name ("CellPoint 1.xlsx")."""
+    return Path(getattr(file, "name", str(file))).stem
+
+
+# ======================================================
+# CLEANING
+# ======================================================
+def clean_branch_frame(df):
+    df.columns = df.columns.str.strip().str.upper()
+    df = df[~df["BRAND NAME"].astype(str).str.contains("TOTAL", case=False)].copy()
+    df["BRAND NAME"] = canonical_brands(df["BRAND NAME"])
+    for col in BRANCH_NUMERIC_COLS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    return compact_frame(df, "Branch", money_cols=BRANCH_NUMERIC_COLS)
+
+
+def clean_staff_frame(df):
+    # Headers arrive flattened ("HANDSET_TARGET") with SALESMAN first
+    df = df.rename(columns=STAFF_COLUMN_NAMES)
+    df = df[df["SALESMAN"].astype(str).str.upper() != "TOTAL"].copy()
+    for col in STAFF_COLUMN_NAMES.values():
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return compact_frame(
+        df, "Staff", money_cols=STAFF_COLUMN_NAMES.values(), text_cols=["SALESMAN"]
+    )
+
+
+# ======================================================
+# CACHED LOADERS
+# ======================================================
+def _parse_branch(data):
+    # Only the columns the pages use, stopping at the TOTAL row
+    return clean_branch_frame(read_sheet(data, columns=BRANCH_COLUMNS, stop_at="TOTAL"))
+
+
+def _parse_staff(data):
+    # Grouped header found (and its layout cached) per export template
+    return clean_staff_frame(read_sheet(
+        data,
+        columns=STAFF_COLUMNS,
+        header_rows=None,
+        first_column="SALESMAN",
+        stop_at="TOTAL"
+    ))
+
+
+_PARSERS = {"branch": _parse_branch, "staff": _parse_staff}
+
+
+def _load(kind, file):
+    data = upload_bytes(file)
+    key = (kind, digest(data))
+    df = _frames.get(key)
+    if df is None:
+        df = _frames.put(key, _PARSERS[kind](data))
+    # Pages add derived columns in place, never hand out the cached frame
+    return df.copy()
+
+
+def load_branch_excel(file):
+    """Brand-wise branch sheet: normalized headers, no TOTAL rows, numeric targets."""
+    return _load("branch", file)
+
+
+def load_staff_excel(file):
+    """Staff sheet with the grouped HANDSET / ACCESSORIES header flattened."""
+    return _load("staff", file)
+
+
+# ======================================================
+# PARALLEL LOADING (MULTI-FILE UPLOADS)
+# ======================================================
+# openpyxl parsing is CPU-bound and holds the GIL, so several workbooks
+# are parsed in worker processes. Spawned workers behave the same on
+# the Linux server and the Windows shop-floor PCs, and avoid forking a
+# multi-threaded Streamlit server.
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _worker_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def load_many(files, kind="branch", on_progress=None):
+    """Load several uploads at once, keyed by store name.
+
+    Returns (frames, errors): a bad workbook is reported in errors and
+    does not stop the others. Files that share a store name are all
+    rejected rather than one silently replacing another. on_progress(name,
+    state) is called on the calling thread with state "cached",
+    "parsing", "done" or "failed".
+    """
+    progress = on_progress or (lambda name, state: None)
+    names = [store_name(f) for f in files]
+    frames, errors, pending = {}, {}, {}
+
+    counts = Counter(names)
+    for name, count in counts.items():
+        if count > 1:
+            errors[name] = ValueError(
+                f"{count} files are named {name!r}; upload one file per store"
+            )
+            progress(name, "failed")
+
+    for name, f in zip(names, files):
+        if name in errors:
+            continue
+        data = upload_bytes(f)
+        key = (kind, digest(data))
+        df = _frames.get(key)
+        if df is not None:
+            frames[name] = df
+            progress(name, "cached")
+        else:
+            pending[name] = (key, data)
+            progress(name, "parsing")
+
+    def _finish(name, key, parse):
+        try:
+            frames[name] = _frames.put(key, parse())
+            progress(name, "done")
+        except Exception as exc:
+            errors[name] = exc
+            progress(name, "failed")
+
+    if len(pending) == 1:
+        # A single workbook is not worth the worker round-trip
+        (name, (key, data)), = pending.items()
+        _finish(name, key, lambda: _PARSERS[kind](data))
+    elif pending:
+        retry = {}
+        try:
+            pool = _worker_pool()
+            futures = {
+                pool.submit(_PARSERS[kind], data): (name, key)
+                for name, (key, data) in pending.items()
+            }
+        except BrokenProcessPool:
+            futures, retry = {}, dict(pending)
+
+        for future in as_completed(futures):
+            name, key = futures[future]
+            if isinstance(future.exception(), BrokenProcessPool):
+                retry[name] = pending[name]
+            else:
+                _finish(name, key, future.result)
+
+        if retry:
+            # A worker died or could not start: finish on this thread
+            _reset_pool()
+            for name, (key, data) in retry.items():
+                _finish(name, key, lambda: _PARSERS[kind](data))
+
+    frames = {name: frames[name].copy() for name in names if name in frames}
+    return frames, errors
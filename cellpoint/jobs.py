@@ -0,0 +1,117 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Background render jobs shared by every session
+# ======================================================
+#
+# ReportLab builds and the matplotlib chart they embed used to run on
+# the Streamlit script thread: the page froze until the PDF was done
+# and a second user's render queued behind the first. Renders now go to
+# one small thread pool shared by all sessions. A job is keyed like the
+# report cache, so a second request for the same key (another session,
+# or a rerun) joins the job already in flight instead of starting its
+# own, and finished bytes land in the report cache as before.
+#
+# Threads rather than processes: the builders take DataFrames and share
+# the chart figure cache, and a render is short enough that pickling the
+# inputs to a worker process would cost more than it frees.
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cellpoint.cache import LRUCache
+from cellpoint.reports import _builder, cached_report, report_bytes
+
+log = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get("CELLPOINT_JOB_WORKERS", 2))
+
+# Job records only; the rendered bytes live in the report cache
+_jobs = LRUCache(max_entries=256, ttl=60 * 60)
+_submit_lock = threading.Lock()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class Job:
+    """One render: state, progress (0–1) and, when done, the bytes."""
+
+    def __init__(self, key):
+        self.key = key
+        self.state = "queued"
+        self.progress = 0.0
+        self.message = "Queued"
+        self.result = None
+        self.error = None
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+
+    @property
+    def done(self):
+        return self.state in ("done", "failed")
+
+    def elapsed(self):
+        """Seconds since submitted, or the total once finished."""
+        return (self.finished or time.monotonic()) - self.submitted
+
+    def _step(self, progress, message, state="running"):
+        self.progress, self.message, self.state = progress, message, state
+
+
+def _job_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="cellpoint-job")
+        return _pool
+
+
+def _run(job, build, args, kwargs):
+    job.started = time.monotonic()
+    try:
+        job._step(0.2, "Loading renderer")
+        builder = _builder(build)
+        job._step(0.5, "Rendering")
+        job.result = cached_report(job.key, builder, *args, **kwargs)
+        job._step(1.0, "Ready", "done")
+    except Exception as exc:
+        log.exception("Render job %s failed", job.key)
+        job.error = exc
+        job._step(job.progress, str(exc), "failed")
+    finally:
+        job.finished = time.monotonic()
+
+
+def submit(key, build, *args, **kwargs):
+    """Job rendering build(*args, **kwargs) for key, started if not already.
+
+    An identical job that is queued, running or done is returned as is;
+    a failed one stays failed until forget(key).
+    """
+    with _submit_lock:
+        job = _jobs.get(key)
+        if job is not None:
+            return job
+
+        job = _jobs.put(key, Job(key))
+        cached = report_bytes(key)
+        if cached is not None:
+            job.result = cached
+            job._step(1.0, "Ready", "done")
+            job.finished = time.monotonic()
+        else:
+            _job_pool().submit(_run, job, build, args, kwargs)
+        return job
+
+
+def find(key):
+    return _jobs.get(key)
+
+
+def forget(key):
+    """Drop the job record for key, e.g. to retry a failed render."""
+    _jobs.discard(key)
@@ -0,0 +1,203 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Incremental month-to-date aggregates
+# ======================================================
+#
+# Branch sheets carry cumulative month-to-date ACHIEVEMENT. Each day's
+# upload is folded into a small per-store ledger (one row per brand per
+# recorded day) holding the cumulative figures and the sales since the
+# previous recorded day. Queries slice a single day out of the sorted
+# ledger, so they cost O(brands) no matter how much history exists.
+#
+# Re-recording a past day (a corrected sheet) recomputes only that
+# day's deltas and the next recorded day's, which depend on it.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from cellpoint import history
+
+LEDGER_COLS = ["DATE", "BRAND NAME", "MONTHLY TARGET", "ACHIEVEMENT", "DAY SALES", "GAP DAYS"]
+
+_ledgers = {}
+_ledgers_lock = threading.Lock()
+
+
+def month_to_date(store, report_date, root=None):
+    """Shared ledger for store in report_date's month."""
+    key = (store, report_date.year, report_date.month, root)
+    with _ledgers_lock:
+        if key not in _ledgers:
+            _ledgers[key] = MonthToDate(store, report_date, root)
+        return _ledgers[key]
+
+
+def record_day(store, report_date, df, root=None):
+    """Fold a saved upload into store's ledger; the pages' only write path."""
+    return month_to_date(store, report_date, root).record(report_date, df)
+
+
+def day_totals(store, report_date, df, root=None):
+    """totals() on report_date, read-only.
+
+    The ledger is used only when the day it recorded holds df's figures.
+    Otherwise (nothing recorded yet, a corrected sheet, or another
+    store's ledger) the figures come from df itself (the same
+    achievement / day run rate) and the velocities are None.
+    """
+    ledger = month_to_date(store, report_date, root)
+    if ledger.holds(report_date, df):
+        return ledger.totals(report_date)
+    achievement = df["ACHIEVEMENT"].sum()
+    return {"date": None, "achievement": achievement, "target": df["MONTHLY TARGET"].sum(),
+            "run_rate": achievement / report_date.day, "last_day_sales": None,
+            "recent_velocity": None}
+
+
+def _brand_rows(df):
+    """One row per brand of a cleaned branch sheet, as the ledger stores it."""
+    rows = (
+        df.groupby("BRAND NAME", as_index=False, observed=True)
+        [["MONTHLY TARGET", "ACHIEVEMENT"]]
+        .sum()
+    )
+    # Plain labels: each day's upload can carry its own category set
+    rows["BRAND NAME"] = rows["BRAND NAME"].astype(str)
+    return rows
+
+
+def _same_day(current, rows):
+    """True when a re-upload carries exactly the figures already recorded."""
+    if len(current) != len(rows):
+        return False
+    rows = rows.iloc[rows["BRAND NAME"].astype(str).argsort()]
+    current = current.iloc[current["BRAND NAME"].astype(str).argsort()]
+    cols = ["MONTHLY TARGET", "ACHIEVEMENT"]
+    return (
+        current["BRAND NAME"].astype(str).tolist() == rows["BRAND NAME"].astype(str).tolist()
+        and np.array_equal(current[cols].to_numpy("float64"), rows[cols].to_numpy("float64"))
+    )
+
+
+class MonthToDate:
+
+    def __init__(self, store, report_date, root=None):
+        self.store = store
+        self.month_start = report_date.replace(day=1)
+        self.root = root
+        self._lock = threading.Lock()
+
+        saved = history.load("mtd", store, self.month_start, root)
+        self.ledger = saved if saved is not None else pd.DataFrame({c: [] for c in LEDGER_COLS})
+        self.ledger["DATE"] = pd.to_datetime(self.ledger["DATE"]).astype("datetime64[ns]")
+
+    # ---------------- INDEX HELPERS ----------------
+    def _dates(self):
+        return self.ledger["DATE"].to_numpy()
+
+    def _bounds(self, day):
+        dates = self._dates()
+        day = np.datetime64(day, "ns")
+        return dates.searchsorted(day, "left"), dates.searchsorted(day, "right")
+
+    def _recorded_days(self):
+        return pd.unique(self._dates())
+
+    def _neighbour(self, day, before):
+        days = self._recorded_days()
+        pos = days.searchsorted(np.datetime64(day, "ns"), "left" if before else "right")
+        if before:
+            return pd.Timestamp(days[pos - 1]) if pos > 0 else None
+        return pd.Timestamp(days[pos]) if pos < len(days) else None
+
+    # ---------------- UPDATE ----------------
+    def record(self, report_date, df):
+        """Fold one day's cleaned branch sheet in; returns True if anything changed."""
+        day = pd.Timestamp(report_date)
+        rows = _brand_rows(df)
+
+        with self._lock:
+            lo, hi = self._bounds(day)
+            if lo < hi and _same_day(self.ledger.iloc[lo:hi], rows):
+                return False
+
+            rows.insert(0, "DATE", day)
+            rows["DAY SALES"] = 0.0
+            rows["GAP DAYS"] = 0
+            self.ledger = (
+                pd.concat([self.ledger.iloc[:lo], rows, self.ledger.iloc[hi:]], ignore_index=True)
+                .sort_values(["DATE", "BRAND NAME"], kind="stable")
+                .reset_index(drop=True)
+            )
+
+            # Targeted recompute: this day and the day that follows it
+            self._refresh_deltas(day)
+            following = self._neighbour(day, before=False)
+            if following is not None:
+                self._refresh_deltas(following)
+
+            history.save(self.ledger, "mtd", self.store, self.month_start, root=self.root)
+        return True
+
+    def _refresh_deltas(self, day):
+        lo, hi = self._bounds(day)
+        cum = self.ledger.iloc[lo:hi].set_index("BRAND NAME")["ACHIEVEMENT"]
+
+        previous = self._neighbour(day, before=True)
+        if previous is None:
+            before, gap = 0, day.day
+        else:
+            plo, phi = self._bounds(previous)
+            before = (
+                self.ledger.iloc[plo:phi].set_index("BRAND NAME")["ACHIEVEMENT"]
+                .reindex(cum.index, fill_value=0)
+            )
+            gap = (day - previous).days
+
+        self.ledger.iloc[lo:hi, self.ledger.columns.get_loc("DAY SALES")] = (cum - before).to_numpy()
+        self.ledger.iloc[lo:hi, self.ledger.columns.get_loc("GAP DAYS")] = gap
+
+    # ---------------- QUERIES ----------------
+    def holds(self, report_date, df):
+        """True when report_date is recorded with exactly df's figures."""
+        rows = _brand_rows(df)
+        with self._lock:
+            lo, hi = self._bounds(pd.Timestamp(report_date))
+            return lo < hi and _same_day(self.ledger.iloc[lo:hi], rows)
+
+    def snapshot(self, as_of):
+        """Per-brand month-to-date figures as of the latest recorded day <= as_of."""
+        with self._lock:
+            days = self._recorded_days()
+            pos = days.searchsorted(np.datetime64(pd.Timestamp(as_of), "ns"), "right")
+            if pos == 0:
+                return self.ledger.iloc[:0].copy()
+            day = pd.Timestamp(days[pos - 1])
+            lo, hi = self._bounds(day)
+            snap = self.ledger.iloc[lo:hi].copy()
+
+        snap["DAILY VELOCITY"] = snap["ACHIEVEMENT"] / day.day
+        snap["RECENT VELOCITY"] = snap["DAY SALES"] / snap["GAP DAYS"].where(snap["GAP DAYS"] > 0)
+        return snap.reset_index(drop=True)
+
+    def totals(self, as_of):
+        """Store-level month-to-date totals and run rates as of as_of."""
+        snap = self.snapshot(as_of)
+        if snap.empty:
+            return {"date": None, "achievement": 0, "target": 0,
+                    "run_rate": 0, "last_day_sales": 0, "recent_velocity": 0}
+
+        day = snap["DATE"].iloc[0]
+        gap = int(snap["GAP DAYS"].iloc[0])
+        achievement = snap["ACHIEVEMENT"].sum()
+        last_day_sales = snap["DAY SALES"].sum()
+        return {
+            "date": day.date(),
+            "achievement": achievement,
+            "target": snap["MONTHLY TARGET"].sum(),
+            "run_rate": achievement / day.day,
+            "last_day_sales": last_day_sales,
+            "recent_velocity": last_day_sales / gap if gap else 0,
+        }
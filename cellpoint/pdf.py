@@ -0,0 +1,412 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: PDF reports (Streamlit-free)
+# ======================================================
+#
+# The three A4 reports, usable from the pages and from the headless
+# batch generator. Everything a report shows is passed in; nothing
+# here reads page state.
+
+from io import BytesIO
+
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.pagesizes import A4
+
+from cellpoint.bands import MRI_STATUS, STAFF_STATUS
+from cellpoint.charts import prediction_png
+from cellpoint.pdftables import BRAND_TABLE_STYLE, STAFF_TABLE_STYLE, build_table
+
+
+# ======================================================
+# SALES – PREDICTION GRAPH IMAGE
+# ======================================================
+def prediction_graph_image(company_ach, predicted_final, company_trgt, days_completed, total_days):
+    return BytesIO(prediction_png(company_ach, predicted_final, company_trgt, days_completed, total_days))
+
+
+# ======================================================
+# SALES – MORNING SALES REPORT
+# ======================================================
+def generate_complete_pdf(
+    df, company_status, company_pct, top_risk,
+    predicted_text, company_ach, predicted_final, company_trgt,
+    action_df, branch_name, report_date, days_completed, days_remaining, total_days
+):
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=20,
+        bottomMargin=20
+    )
+
+    styles = getSampleStyleSheet()
+    elements = []
+
+    # ---------------- HEADER ----------------
+    elements.append(Paragraph(
+        "<b>CELLPOINT SMARTPHONE GALLERY</b><br/>"
+        f"<b>Branch:</b> {branch_name}<br/>"
+        "Morning Sales Review – Full Intelligence Report<br/>"
+        f"<b>Report Date:</b> {report_date}<br/><br/>",
+        styles["Title"]
+    ))
+
+    # ---------------- SUMMARY ----------------
+    elements.append(Paragraph(
+        f"<b>Total Target:</b> ₹{int(company_trgt):,}<br/>"
+        f"<b>Achieved Till Date:</b> ₹{int(company_ach):,}<br/>"
+        f"<b>Pending:</b> ₹{int(company_trgt - company_ach):,}<br/>"
+        f"<b>Company Status:</b> {company_status} ({company_pct:.1f}%)<br/>"
+        f"<b>Days Completed:</b> {days_completed} | "
+        f"<b>Days Remaining:</b> {days_remaining}<br/><br/>",
+        styles["Normal"]
+    ))
+
+    # ---------------- KEY DISCUSSION ----------------
+    elements.append(Paragraph("<b>Key Discussion Points</b>", styles["Heading2"]))
+
+    elements.append(Paragraph(
+        f"<b>Actual vs Predicted Performance</b><br/>"
+        f"Actual Achieved: ₹{int(company_ach):,}<br/>"
+        f"Predicted Month-End: ₹{int(predicted_final):,}<br/>"
+        f"Monthly Target: ₹{int(company_trgt):,}<br/><br/>"
+        f"<b>Biggest Risk Brand</b><br/>"
+        f"{top_risk['BRAND NAME']} — BTD ₹{int(top_risk['BALANCE TO DO']):,}<br/><br/>",
+        styles["Normal"]
+    ))
+
+    status_cache = {}
+
+    # ---------------- CURRENT ANALYSIS TABLE ----------------
+    elements.append(Paragraph(
+        "<b>Current Brand-wise Performance Analysis</b>",
+        styles["Heading2"]
+    ))
+
+    pt = build_table(
+        df,
+        [
+            ("Brand", "BRAND NAME", "text"),
+            ("Target", "MONTHLY TARGET", "int"),
+            ("Achieved", "ACHIEVEMENT", "int"),
+            ("BTD", "BALANCE TO DO", "int"),
+            ("Achievement %", "ACHIEVEMENT %", "pct"),
+            ("Risk Level", "RISK LEVEL", "status"),
+        ],
+        BRAND_TABLE_STYLE,
+        styles["Normal"],
+        status_cache
+    )
+
+    elements.append(pt)
+    elements.append(Spacer(1, 12))
+
+    # ---------------- PREDICTION GRAPH ----------------
+    elements.append(Paragraph("<b>Business Outcome Prediction</b>", styles["Heading2"]))
+    elements.append(
+        Image(
+            prediction_graph_image(
+                company_ach, predicted_final, company_trgt, days_completed, total_days
+            ),
+            width=480,
+            height=220
+        )
+    )
+    elements.append(Spacer(1, 12))
+
+    # ---------------- ACTION PLAN TABLE ----------------
+    elements.append(Paragraph(
+        "<b>What To Do Next – Action Plan</b>",
+        styles["Heading2"]
+    ))
+
+    at = build_table(
+        action_df,
+        [
+            ("Brand", "Brand", "text"),
+            ("BTD", "BALANCE TO DO", "int"),
+            ("Required / Day", "Required / Day", "int"),
+            ("Normal Daily", "Normal Daily", "int"),
+            ("Difficulty", "Difficulty", "status"),
+        ],
+        BRAND_TABLE_STYLE,
+        styles["Normal"],
+        status_cache
+    )
+
+    elements.append(at)
+    elements.append(Spacer(1, 14))
+
+    # ---------------- FINAL INSIGHTS ----------------
+    elements.append(Paragraph(
+        "<b>Morning Sales Meeting – Key Takeaways</b>",
+        styles["Heading2"]
+    ))
+
+    elements.append(Paragraph(
+        '<font color="green">🟢 Excellent:</font> Maintain pace.<br/>'
+        '<font color="orange">🟡 Good:</font> Minor push required.<br/>'
+        '<font color="darkorange">🟠 Average:</font> Focused selling needed.<br/>'
+        '<font color="red">🔴 Very High:</font> Immediate corrective action required.',
+        styles["Normal"]
+    ))
+
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
+
+
+# ======================================================
+# CELLSUM & MRI REPORT
+# ======================================================
+
+def generate_cellsum_mri_pdf(
+    cellsum_df, total_trgt, total_ach, total_pct,
+    run_rate, predicted_final, cellsum_carrier,
+    mri_df, mri_pct
+):
+
+    buffer = BytesIO()
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=20,
+        bottomMargin=20
+    )
+
+    styles = getSampleStyleSheet()
+
+    status_cache = {}
+
+    elements = []
+
+    # ---------------- HEADER ----------------
+    elements.append(Paragraph(
+        "<b>CELLPOINT – CELLSUM & MRI REPORT</b><br/>"
+        "Owner Intelligence Summary<br/><br/>",
+        styles["Title"]
+    ))
+
+    # ---------------- SUMMARY ----------------
+    elements.append(Paragraph(
+        f"<b>Total Target:</b> ₹{int(total_trgt):,}<br/>"
+        f"<b>Total Achieved:</b> ₹{int(total_ach):,}<br/>"
+        f"<b>Achievement %:</b> {total_pct:.1f}%<br/>"
+        f"<b>Run Rate:</b> ₹{run_rate/1e5:.2f} L / day<br/>"
+        f"<b>Predicted Final:</b> ₹{int(predicted_final):,}<br/>"
+        f"<b>CELLSUM Carrier:</b> {cellsum_carrier}<br/><br/>",
+        styles["Normal"]
+    ))
+
+    # ---------------- CELLSUM TABLE ----------------
+    elements.append(Paragraph("<b>Brand Performance Summary</b>", styles["Heading2"]))
+
+    table = build_table(
+        cellsum_df,
+        [
+            ("Brand", "BRAND NAME", "text"),
+            ("Target", "MONTHLY TARGET", "int"),
+            ("Achieved", "ACHIEVEMENT", "int"),
+            ("Achievement %", "ACHIEVEMENT %", "pct"),
+            ("Risk Level", "RISK LEVEL", "status"),
+        ],
+        BRAND_TABLE_STYLE,
+        styles["Normal"],
+        status_cache
+    )
+
+    elements.append(table)
+
+
+    # ---------------- MRI SECTION ----------------
+    elements.append(Spacer(1, 16))
+    elements.append(Paragraph(
+    "<b>🧠 MRI – Internal Brand-Mix Intelligence</b>",
+    styles["Heading2"]
+))
+
+    elements.append(Paragraph(
+    f"<b>Overall MRI Alignment:</b> "
+    f"{MRI_STATUS.label(mri_pct)} "
+    f"({mri_pct:.1f}%)<br/><br/>",
+    styles["Normal"]
+))
+
+
+    tbl = build_table(
+        mri_df,
+        [
+            ("Brand", "BRAND NAME", "text"),
+            ("MRI Target", "MRI TARGET", "int"),
+            ("Achieved", "ACHIEVEMENT", "int"),
+            ("MRI %", "MRI %", "pct"),
+            ("MRI Status", "MRI STATUS", "status"),
+        ],
+        BRAND_TABLE_STYLE,
+        styles["Normal"],
+        status_cache
+    )
+
+    elements.append(tbl)
+
+
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
+
+
+# ======================================================
+# EMPLOYEE INTELLIGENCE REPORT
+# ======================================================
+def generate_employee_pdf(
+    df, df_handset, df_accessory, df_combined,
+    effective_top, effective_top_handset, effective_top_accessory,
+    risk_accessory, team_avg_pct, team_status, branch_name, report_date
+):
+    buffer = BytesIO()
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=32,
+        leftMargin=32,
+        topMargin=28,
+        bottomMargin=28
+    )
+
+    styles = getSampleStyleSheet()
+    styles["Normal"].fontSize = 8
+    styles["Normal"].leading = 11
+    styles["Heading2"].fontSize = 9
+    styles["Heading2"].leading = 12
+
+    elements = []
+
+    # ------------------------------
+    # HEADER
+    # ------------------------------
+    elements.append(Paragraph(
+        f"""
+        <para align="center">
+        <b>CELLPOINT – EMPLOYEE INTELLIGENCE REPORT</b><br/>
+        <font size="8">
+        Branch: {branch_name} &nbsp;&nbsp;|&nbsp;&nbsp;
+        Report Date: {report_date}
+        </font>
+        </para>
+        """,
+        styles["Normal"]
+    ))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph(
+    f"""
+    <b>🏆 Executive Performance Summary</b><br/>
+    • <b>Top Performer:</b> {effective_top['SALESMAN']}
+    ({effective_top['OVERALL_%']:.1f}%)<br/>
+    • <b>Top Handset:</b> {effective_top_handset['SALESMAN']} 
+    ({effective_top_handset['HS_%']:.1f}%)<br/>
+    • <b>Top Accessories:</b> {effective_top_accessory['SALESMAN']} 
+    ({effective_top_accessory['ACC_%']:.1f}%)<br/>
+    • <b>Team Average:</b> {team_avg_pct:.1f}%<br/>
+    • <b>Overall Team Status:</b> {team_status}
+    """,
+    styles["Normal"]
+    ))
+    elements.append(Spacer(1, 14))
+
+    # ------------------------------
+    # TABLE BUILDER (COMFORT SIZE)
+    # ------------------------------
+    status_cache = {}
+
+    def add_table(title, cols, dfv):
+        elements.append(Paragraph(f"<b>{title}</b>", styles["Heading2"]))
+        elements.append(Spacer(1, 6))
+
+        # Chain-wide roster: say which store each salesman is in
+        if "STORE" in dfv.columns and dfv["STORE"].nunique() > 1:
+            cols = cols[:1] + ["STORE"] + cols[1:]
+
+        columns = []
+        for c in cols:
+            if c in ["HS_STATUS", "ACC_STATUS", "FINAL_STATUS"]:
+                columns.append((c, c, "status"))
+            elif "%" in c:
+                columns.append((c, c, "pct"))
+            elif c in ["SALESMAN", "STORE"]:
+                columns.append((c, c, "text"))
+            else:
+                columns.append((c, c, "num"))
+
+        elements.append(build_table(
+            dfv,
+            columns,
+            STAFF_TABLE_STYLE,
+            styles["Normal"],
+            status_cache,
+            colWidths=[110] + [65] * (len(cols) - 1)
+        ))
+        elements.append(Spacer(1, 12))
+
+    # ------------------------------
+    # TABLES
+    # ------------------------------
+    add_table(
+        "📱 Handset Performance",
+        ["SALESMAN", "HS_TARGET", "HS_ACH", "HS_BAL", "HS_%", "HS_STATUS"],
+        df_handset
+    )
+
+    add_table(
+        "🎧 Accessories Performance",
+        ["SALESMAN", "ACC_TARGET", "ACC_ACH", "ACC_BAL", "ACC_%", "ACC_STATUS"],
+        df_accessory
+    )
+
+    add_table(
+        "🧠 Combined Sales Intelligence",
+        ["SALESMAN", "TOTAL_BAL", "OVERALL_%", "FINAL_STATUS"],
+        df_combined
+    )
+
+    # ------------------------------
+    # INSIGHTS
+    # ------------------------------
+    elements.append(Spacer(1, 8))
+    elements.append(Paragraph("<b>📌 Key Insights & Observations</b>", styles["Heading2"]))
+    elements.append(Spacer(1, 4))
+
+    # ADMIN and rows without an accessories target are never the risk area
+    risk_text = (
+        f"{risk_accessory['SALESMAN']} ({risk_accessory['ACC_%']:.1f}%)"
+        if risk_accessory is not None else "—"
+    )
+
+    elements.append(Paragraph(
+        f"""
+        • <b>Top Handset Contributor:</b> {effective_top_handset['SALESMAN']} 
+        ({effective_top_handset['HS_%']:.1f}%)<br/>
+
+        • <b>Accessories Risk Area:</b> {risk_text}<br/>
+
+        • <b>Overall Team Status:</b> {STAFF_STATUS.label(df['OVERALL_%'].mean())}<br/>
+
+        • <b>Recommendation:</b> Improve accessory attachment rate and
+        daily balance clearance for overall uplift.
+        """,
+        styles["Normal"]
+    ))
+
+    # ------------------------------
+    # BUILD PDF
+    # ------------------------------
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,107 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Columnar ReportLab table builder
+# ======================================================
+#
+# The page PDFs used to walk DataFrames with iterrows(), format each
+# number with an f-string and wrap every status cell in a new
+# Paragraph. Here each column is formatted in one go, status cells
+# are shared per distinct label, and TableStyles are built once.
+
+import numpy as np
+from reportlab.platypus import Paragraph, Table, TableStyle
+from reportlab.lib import colors
+
+from cellpoint.bands import COMPANY_STATUS, DIFFICULTY, MRI_STATUS, RISK_LEVEL, STAFF_STATUS
+
+STATUS_COLORS = {}
+for _banding in (RISK_LEVEL, COMPANY_STATUS, MRI_STATUS, STAFF_STATUS, DIFFICULTY):
+    STATUS_COLORS.update(_banding.colors)
+
+# ======================================================
+# TABLE STYLES (ONE PER TABLE KIND)
+# ======================================================
+# Brand tables in the sales and CELLSUM / MRI reports
+BRAND_TABLE_STYLE = TableStyle([
+    ("GRID", (0,0), (-1,-1), 0.4, colors.black),
+    ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
+    ("FONTSIZE", (0,0), (-1,-1), 8),
+    ("ALIGN", (1,1), (-1,-1), "CENTER"),
+])
+
+# Salesman tables in the employee report
+STAFF_TABLE_STYLE = TableStyle([
+    ("GRID", (0,0), (-1,-1), 0.5, colors.black),
+    ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
+    ("ALIGN", (1,1), (-1,-1), "CENTER"),
+    ("ALIGN", (0,0), (0,-1), "LEFT"),
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+    ("FONTSIZE", (0,0), (-1,-1), 8),
+    ("TOPPADDING", (0,0), (-1,-1), 4),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 4),
+])
+
+
+# ======================================================
+# COLUMN FORMATTERS
+# ======================================================
+def format_int(values):
+    """Thousands-separated, truncated like int(x)."""
+    return list(map("{:,}".format, values.to_numpy(dtype="float64").astype("int64").tolist()))
+
+
+def format_num(values):
+    """Thousands-separated, rounded to whole rupees."""
+    return list(map("{:,.0f}".format, values.to_numpy(dtype="float64").tolist()))
+
+
+def format_pct(values):
+    return np.char.mod("%.1f%%", values.to_numpy(dtype="float64")).tolist()
+
+
+def status_cells(labels, style, cache):
+    """Colored Paragraph per label; repeated labels share one flowable.
+
+    The cache belongs to a single document build: ReportLab re-wraps a
+    cell right before drawing it, so sharing inside one build is safe.
+    """
+    cells = []
+    for label in labels.astype(str).tolist():
+        cell = cache.get(label)
+        if cell is None:
+            color = STATUS_COLORS.get(label)
+            text = f"<font color='{color}'>{label}</font>" if color else label
+            cell = cache[label] = Paragraph(text, style)
+        cells.append(cell)
+    return cells
+
+
+_FORMATTERS = {
+    "text": lambda values: values.tolist(),
+    "int": format_int,
+    "num": format_num,
+    "pct": format_pct,
+}
+
+
+# ======================================================
+# TABLE BUILDER
+# ======================================================
+def build_table(df, columns, table_style, cell_style, status_cache, **table_kwargs):
+    """Table from df; columns is a list of (header, column, kind).
+
+    kind is one of text / int / num / pct / status.
+    """
+    cols = []
+    for _, col, kind in columns:
+        if kind == "status":
+            cols.append(status_cells(df[col], cell_style, status_cache))
+        else:
+            cols.append(_FORMATTERS[kind](df[col]))
+
+    data = [[header for header, _, _ in columns]]
+    data.extend(map(list, zip(*cols)))
+
+    table = Table(data, repeatRows=1, **table_kwargs)
+    table.setStyle(table_style)
+    return table
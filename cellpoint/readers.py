@@ -0,0 +1,220 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Excel readers with column projection and early stop
+# ======================================================
+#
+# pd.read_excel materializes every column and every row through the
+# full openpyxl object model, and the pages then throw most of it away.
+# These readers stream rows, keep only the columns a page uses and stop
+# at the TOTAL row.
+#
+# Backends:
+#   openpyxl  read-only streaming openpyxl (always available)
+#   calamine  python-calamine (Rust) when installed, the fastest
+#   pandas    plain pd.read_excel, kept as the reference
+
+import os
+from collections import namedtuple
+from importlib.util import find_spec
+from io import BytesIO
+from itertools import chain, islice
+
+import pandas as pd
+
+from cellpoint.cache import LRUCache
+
+# Checked without importing; the backends load on first read
+HAS_CALAMINE = find_spec("python_calamine") is not None
+
+BACKENDS = ["calamine", "openpyxl", "pandas"]
+
+
+def available_backends():
+    return [b for b in BACKENDS if b != "calamine" or HAS_CALAMINE]
+
+
+def default_backend():
+    """CELLPOINT_EXCEL_BACKEND if set, else the fastest installed backend."""
+    backend = os.environ.get("CELLPOINT_EXCEL_BACKEND")
+    if backend:
+        return backend
+    return "calamine" if HAS_CALAMINE else "openpyxl"
+
+
+# ======================================================
+# HEADER FLATTENING
+# ======================================================
+def _blank(value):
+    return value is None or str(value).strip() == "" or str(value).upper().startswith("UNNAMED")
+
+
+def flatten_header(pairs):
+    """Two-row grouped header → "GROUP_FIELD", or "FIELD" when ungrouped.
+
+    pairs are (group, field) tuples, as in a pandas MultiIndex or the
+    first two rows of a sheet; the group name carries over merged cells.
+    """
+    names = []
+    group = None
+    for a, b in pairs:
+        if not _blank(a):
+            group = a
+        b = "" if b is None else str(b)
+        names.append(f"{group}_{b}".strip().upper() if group is not None else b.strip().upper())
+    return names
+
+
+# ======================================================
+# ROW SOURCES
+# ======================================================
+def _openpyxl_rows(data):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _calamine_rows(data):
+    import python_calamine
+
+    sheet = python_calamine.CalamineWorkbook.from_filelike(BytesIO(data)).get_sheet_by_index(0)
+    for row in sheet.iter_rows():
+        yield [None if v == "" else v for v in row]
+
+
+_ROW_SOURCES = {"openpyxl": _openpyxl_rows, "calamine": _calamine_rows}
+
+
+# ======================================================
+# HEADER LAYOUT
+# ======================================================
+# Staff exports put the grouped HANDSET / ACCESSORIES header on the first
+# two rows, or under a title row or two. Where the header sits and which
+# positions to keep is worked out once per template – the exact header
+# rows – and reused for every workbook exported from it.
+HEADER_SCAN = 6
+
+Layout = namedtuple("Layout", "skip header_rows idx names")
+
+# (idx, names) per header; see sheet_layout
+_layouts = LRUCache(max_entries=64)
+
+
+def _header_names(header):
+    if len(header) > 1:
+        return flatten_header(zip(*header))
+    return ["" if v is None else str(v).strip().upper() for v in header[0]]
+
+
+def _project(names, columns, first_column):
+    """Positions of the requested columns in the sheet header."""
+    if first_column is not None:
+        names = [first_column] + names[1:]
+    if columns is None:
+        return list(range(len(names))), names
+
+    wanted = ([first_column] if first_column is not None else []) + list(columns)
+    missing = [c for c in wanted if c not in names]
+    if missing:
+        raise KeyError(f"Sheet is missing columns: {', '.join(missing)}")
+    return [names.index(c) for c in wanted], wanted
+
+
+def sheet_layout(peek, columns, first_column, header_rows=None):
+    """Layout of the first header in peek (the sheet's top rows) holding every column.
+
+    header_rows None tries a one- and a two-row header at each of the
+    first rows; 1 or 2 pins the header to the top of the sheet.
+    """
+    columns = tuple(columns) if columns is not None else None
+    shapes = [(0, header_rows)] if header_rows else [
+        (skip, depth) for skip in range(len(peek)) for depth in (1, 2)
+    ]
+    for skip, depth in shapes:
+        header = tuple(tuple(row) for row in peek[skip:skip + depth])
+        if len(header) < depth:
+            continue
+        # Keyed on the header alone: the same template may sit at a
+        # different offset, so skip comes from this scan, not the cache
+        key = (header, columns, first_column)
+        projection = _layouts.get(key)
+        if projection is None:
+            try:
+                projection = _project(_header_names(header), columns, first_column)
+            except KeyError:
+                if header_rows:
+                    raise
+                continue
+            _layouts.put(key, projection)
+        return Layout(skip, depth, *projection)
+    raise KeyError(f"No header row with columns: {', '.join(columns or ())}")
+
+
+# ======================================================
+# READER
+# ======================================================
+def _read_pandas(data, columns, header_rows, first_column, stop_at, key_column):
+    if header_rows is None:
+        peek = pd.read_excel(BytesIO(data), header=None, nrows=HEADER_SCAN)
+        peek = peek.astype(object).where(peek.notna(), None).values.tolist()
+        layout = sheet_layout(peek, columns, first_column)
+        skip, header_rows = layout.skip, layout.header_rows
+    else:
+        skip = 0
+    df = pd.read_excel(BytesIO(data), skiprows=skip,
+                       header=list(range(header_rows)) if header_rows > 1 else 0)
+    names = flatten_header(df.columns) if header_rows > 1 else list(df.columns.astype(str).str.strip().str.upper())
+    idx, names = _project(names, columns, first_column)
+    df = df.iloc[:, idx]
+    df.columns = names
+    if stop_at is not None:
+        key = df[key_column or names[0]].astype(str).str.strip().str.upper()
+        hits = (key == stop_at).to_numpy().nonzero()[0]
+        if len(hits):
+            df = df.iloc[:hits[0]]
+    return df.reset_index(drop=True)
+
+
+def read_sheet(data, columns=None, header_rows=1, first_column=None,
+               stop_at=None, key_column=None, backend=None):
+    """First sheet of the workbook in data (bytes) as a DataFrame.
+
+    columns      normalized (stripped, upper-case) header names to keep;
+                 None keeps everything
+    header_rows  1, or 2 for the grouped HANDSET / ACCESSORIES header;
+                 None finds the header in the first HEADER_SCAN rows
+    first_column name forced onto the first column, which is always kept
+    stop_at      stop reading at the first row whose key column equals
+                 this value (e.g. "TOTAL"); the row itself is dropped
+    key_column   column checked for stop_at, default the first kept one
+    """
+    backend = backend or default_backend()
+    if backend == "pandas":
+        return _read_pandas(data, columns, header_rows, first_column, stop_at, key_column)
+
+    rows = _ROW_SOURCES[backend](data)
+    try:
+        peek = list(islice(rows, HEADER_SCAN if header_rows is None else header_rows))
+        layout = sheet_layout(peek, columns, first_column, header_rows)
+        idx, names = layout.idx, layout.names
+        key_pos = names.index(key_column) if key_column else 0
+
+        # Column lists, not row records: no wide object frame in between
+        values = [[] for _ in idx]
+        for row in chain(peek[layout.skip + layout.header_rows:], rows):
+            kept = [row[i] if i < len(row) else None for i in idx]
+            if all(v is None for v in kept):
+                continue
+            if stop_at is not None and str(kept[key_pos]).strip().upper() == stop_at:
+                break
+            for column, v in zip(values, kept):
+                column.append(v)
+    finally:
+        rows.close()
+
+    df = pd.DataFrame(dict(enumerate(values)))
+    df.columns = names
+    return df
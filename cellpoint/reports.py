@@ -0,0 +1,43 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Deferred, memoized PDF reports
+# ======================================================
+#
+# ReportLab builds (plus the embedded matplotlib chart) used to run on
+# every rerun just to hand bytes to st.download_button. Reports are now
+# built only when asked for, once per input hash, on the background pool
+# in cellpoint.jobs.
+# Builders can be named as "module:function" so ReportLab and
+# matplotlib are not imported until the first render.
+
+from importlib import import_module
+
+from cellpoint.cache import LRUCache
+
+_reports = LRUCache(max_entries=64, ttl=6 * 60 * 60, max_bytes=128 * 1024 * 1024)
+
+
+def report_key(page, data_digest, report_date, branch=None):
+    """Everything a report depends on: page, uploaded data, date and branch."""
+    return (page, data_digest, str(report_date), branch)
+
+
+def _builder(build):
+    if isinstance(build, str):
+        module, name = build.split(":")
+        build = getattr(import_module(module), name)
+    return build
+
+
+def cached_report(key, build, *args, **kwargs):
+    """PDF bytes for key, calling build(*args, **kwargs) only on a cache miss."""
+    def _build():
+        out = _builder(build)(*args, **kwargs)
+        return out.getvalue() if hasattr(out, "getvalue") else out
+
+    return _reports.get_or_compute(key, _build)
+
+
+def report_bytes(key):
+    """PDF bytes already built for key, else None."""
+    return _reports.get(key)
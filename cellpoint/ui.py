@@ -0,0 +1,154 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Streamlit widgets shared by the pages
+# ======================================================
+#
+# The only cellpoint module that imports Streamlit; the batch generator
+# and the benchmarks never load it.
+
+import streamlit as st
+
+from cellpoint import history, jobs
+from cellpoint.ingest import load_many, store_name, upload_digest
+from cellpoint.reports import cached_report, report_bytes
+
+POLL_SECONDS = 0.5
+
+_ICONS = {"cached": "✅", "parsing": "⏳", "done": "✅", "failed": "❌"}
+
+
+def combined_digest(digests):
+    """One key for a set of per-store uploads."""
+    return "|".join(f"{name}:{d}" for name, d in sorted(digests.items()))
+
+
+def store_frames(files, page, report_date, kind="branch", noun="store", on_save=None):
+    """({store: frame}, {store: digest}) from one upload per store.
+
+    Uploads are parsed together behind a live status box and offered
+    for saving with save_uploads; with nothing uploaded, the history
+    saved for page on report_date is shown instead.
+    """
+    frames, digests = {}, {}
+
+    if files:
+        uploads = {store_name(f): f for f in files}
+
+        with st.status(f"📥 Reading {noun} files", expanded=False) as load_status:
+            file_lines = {name: st.empty() for name in uploads}
+
+            def show_progress(name, state):
+                file_lines[name].write(f"{_ICONS[state]} {name} – {state}")
+
+            frames, load_errors = load_many(files, kind=kind, on_progress=show_progress)
+            load_status.update(
+                label=f"📥 {len(frames)} of {len(files)} {noun} files ready",
+                state="error" if load_errors else "complete"
+            )
+
+        for name, exc in load_errors.items():
+            st.error(f"❌ Could not read {name}: {exc}")
+
+        digests = {name: upload_digest(uploads[name]) for name in frames}
+        save_uploads(page, report_date, frames, digests, on_save)
+    else:
+        for name in history.stores(page, report_date):
+            frames[name] = history.load(page, name, report_date)
+            digests[name] = history.saved_digest(page, name, report_date)
+        if frames:
+            st.caption(f"📚 Showing saved {noun} files for {report_date}: {', '.join(frames)}")
+
+    return frames, digests
+
+
+def save_uploads(page, report_date, frames, digests, on_save=None):
+    """"Save as <date>" action: uploads reach history only when clicked.
+
+    Pages rerun on every widget change, so nothing is written as a side
+    effect of changing the date or store. Stores whose partition for
+    report_date already holds the same upload show as saved; one holding
+    a different upload is replaced only after the user confirms.
+    on_save(store, report_date, frame) runs for each store written, e.g.
+    cellpoint.mtd.record_day for branch sheets.
+    """
+    saved = {name: history.saved_digest(page, name, report_date) for name in frames}
+    done = [name for name in frames if saved[name] == digests[name]]
+    todo = [name for name in frames if saved[name] != digests[name]]
+
+    if done:
+        st.caption(f"💾 Saved as {report_date}: {', '.join(done)}")
+    if not todo:
+        return
+
+    conflicts = [name for name in todo if saved[name] is not None]
+    if conflicts:
+        st.warning(
+            f"⚠️ A different upload is already saved for {report_date}: {', '.join(conflicts)}"
+        )
+        if not st.checkbox(f"Replace the saved {report_date} upload", key=f"replace:{page}"):
+            todo = [name for name in todo if name not in conflicts]
+
+    label = f"💾 Save as {report_date}" + (f" / {', '.join(todo)}" if todo else "")
+    if st.button(label, disabled=not todo, key=f"save:{page}"):
+        failed = [
+            name for name in todo
+            if not history.save(frames[name], page, name, report_date, digests[name], replace=True)
+        ]
+        if on_save is not None:
+            for name in todo:
+                if name not in failed:
+                    on_save(name, report_date, frames[name])
+        if failed:
+            st.error(f"❌ Could not save {', '.join(failed)}; see the server log")
+        else:
+            st.rerun()
+
+
+def report_download(label, file_name, key, build, *args, **kwargs):
+    """Download button for a PDF rendered on the shared job pool, on demand.
+
+    Nothing is built until "Prepare PDF" is clicked (or another session
+    already built or started the same key). A fragment then polls the
+    job without rerunning the page. The download button is handed a
+    callable, so the bytes are fetched from the report cache only when
+    it is clicked rather than resent on every rerun.
+    """
+    job = jobs.find(key)
+    if job is None and report_bytes(key) is None:
+        if not st.button("🛠️ Prepare PDF", key=f"prepare:{file_name}"):
+            return
+        job = jobs.submit(key, build, *args, **kwargs)
+
+    def download():
+        # Served from the cache; rebuilt here only if it was evicted since
+        st.download_button(
+            label,
+            lambda: cached_report(key, build, *args, **kwargs),
+            file_name,
+            "application/pdf",
+            on_click="ignore"
+        )
+
+    if job is None:
+        download()
+        return
+
+    polling = not job.done
+
+    @st.fragment(run_every=POLL_SECONDS if polling else None)
+    def status():
+        if polling and job.done:
+            # Redraw the page once so the fragment stops polling
+            st.rerun()
+
+        if job.state == "done":
+            download()
+        elif job.state == "failed":
+            st.error(f"❌ Could not build the report: {job.error}")
+            if st.button("🔁 Retry", key=f"retry:{file_name}"):
+                jobs.forget(key)
+                st.rerun()
+        else:
+            st.progress(job.progress, text=f"⏳ {job.message} – {job.elapsed():.1f}s")
+
+    status()
@@ -0,0 +1,90 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Client-rendered chart specs (Vega-Lite)
+# ======================================================
+#
+# Small pre-aggregated frames plus Vega-Lite specs for
+# st.vega_lite_chart. The browser draws them, so hover, zoom and pan
+# cost no rerun and the server ships a few dozen points, not a PNG.
+
+import pandas as pd
+
+# Brands beyond this many are shown as one slice
+PIE_SLICES = 12
+
+
+# ======================================================
+# COPER AI – TRAJECTORY
+# ======================================================
+def trajectory_frame(company_ach, predicted_final, company_trgt, days_completed, total_days):
+    """Actual, projected and target lines as (DAY, SALES, SERIES) points."""
+    return pd.DataFrame({
+        "DAY": [0, days_completed, days_completed, total_days, 0, total_days],
+        "SALES": [0, company_ach, company_ach, predicted_final, company_trgt, company_trgt],
+        "SERIES": ["Actual", "Actual", "AI Projection", "AI Projection",
+                   "Monthly Target", "Monthly Target"],
+    }).astype({"SALES": "float64"})
+
+
+def trajectory_spec():
+    return {
+        "title": "COPER AI – Outcome Projection",
+        "params": [{"name": "zoom", "select": "interval", "bind": "scales"}],
+        "mark": {"type": "line", "point": True, "strokeWidth": 2},
+        "encoding": {
+            "x": {"field": "DAY", "type": "quantitative", "title": "Day of Month"},
+            "y": {"field": "SALES", "type": "quantitative", "title": "Cumulative Sales (₹)",
+                  "axis": {"format": ",.0f"}},
+            "color": {"field": "SERIES", "type": "nominal", "title": None},
+            "strokeDash": {
+                "field": "SERIES", "type": "nominal", "legend": None,
+                "scale": {"domain": ["Actual", "AI Projection", "Monthly Target"],
+                          "range": [[1, 0], [6, 4], [2, 2]]}
+            },
+            "tooltip": [
+                {"field": "SERIES", "type": "nominal", "title": "Series"},
+                {"field": "DAY", "type": "quantitative", "title": "Day"},
+                {"field": "SALES", "type": "quantitative", "title": "Sales (₹)", "format": ",.0f"},
+            ],
+        },
+    }
+
+
+# ======================================================
+# BRAND CONTRIBUTION
+# ======================================================
+def contribution_frame(df, slices=PIE_SLICES):
+    """(BRAND, ACHIEVEMENT, SHARE) for brands that sold, the tail folded into one row."""
+    sold = df.loc[df["ACHIEVEMENT"] > 0, ["BRAND NAME", "ACHIEVEMENT"]]
+    sold = sold.sort_values("ACHIEVEMENT", ascending=False)
+
+    pie = sold.head(slices).rename(columns={"BRAND NAME": "BRAND"})
+    if len(sold) > slices:
+        rest = sold["ACHIEVEMENT"].iloc[slices:].sum()
+        pie = pd.concat([pie, pd.DataFrame({
+            "BRAND": [f"Other brands ({len(sold) - slices})"], "ACHIEVEMENT": [rest]
+        })], ignore_index=True)
+
+    pie["BRAND"] = pie["BRAND"].astype(str)
+    pie["ACHIEVEMENT"] = pie["ACHIEVEMENT"].astype("float64")
+    pie["SHARE"] = pie["ACHIEVEMENT"] / pie["ACHIEVEMENT"].sum()
+    return pie.reset_index(drop=True)
+
+
+def contribution_spec():
+    return {
+        "title": "Revenue Contribution by Brand",
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": "ACHIEVEMENT", "type": "quantitative", "stack": True},
+            "color": {"field": "BRAND", "type": "nominal", "title": "Brand",
+                      "sort": {"field": "ACHIEVEMENT", "order": "descending"}},
+            "order": {"field": "ACHIEVEMENT", "type": "quantitative", "sort": "descending"},
+            "tooltip": [
+                {"field": "BRAND", "type": "nominal", "title": "Brand"},
+                {"field": "ACHIEVEMENT", "type": "quantitative", "title": "Achieved (₹)",
+                 "format": ",.0f"},
+                {"field": "SHARE", "type": "quantitative", "title": "Share", "format": ".1%"},
+            ],
+        },
+    }
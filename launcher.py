@@ -0,0 +1,93 @@
+# ======================================================
+# PROJECT: CELLpick Intelligence System
+# MODULE: Packaged launcher (PyInstaller entry point)
+# ======================================================
+#
+# Starts the Streamlit server in-process on main.py (pages/ next to it)
+# instead of running main.py as a plain console script. While the
+# server boots and the browser opens, pandas / openpyxl and the
+# CellPoint loaders are imported on a background thread so the first
+# upload does not pay for them. The time from launch to a listening
+# server is printed as the cold-start time.
+#
+#   python launcher.py            (or the frozen CELLPOINT build)
+#   CELLPOINT_PORT=8502 python launcher.py
+
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+
+STARTED = time.perf_counter()
+
+# Modules the pages need as soon as something is uploaded
+PREWARM = [
+    "numpy",
+    "pandas",
+    "openpyxl",
+    "cellpoint.ingest",
+    "cellpoint.analytics",
+    "cellpoint.history",
+    "cellpoint.mtd",
+]
+
+
+def base_dir():
+    """Folder holding main.py and pages/, unpacked or not."""
+    return getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+
+
+def prewarm():
+    for name in PREWARM:
+        try:
+            __import__(name)
+        except ImportError as exc:
+            print(f"⚠️ Pre-warm skipped {name}: {exc}", flush=True)
+    print(f"🔥 Pre-warmed {len(PREWARM)} modules in {time.perf_counter() - STARTED:.2f}s", flush=True)
+
+
+def report_ready(port, timeout=120):
+    """Print the cold-start time once the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                print(f"🚀 CELLPOINT ready on port {port} – cold start "
+                      f"{time.perf_counter() - STARTED:.2f}s", flush=True)
+                return
+        except OSError:
+            time.sleep(0.05)
+    print(f"⚠️ Server not reachable on port {port} after {timeout}s", flush=True)
+
+
+def main():
+    # Upload parsing and the batch generator use spawn process pools
+    multiprocessing.freeze_support()
+
+    root = base_dir()
+    sys.path.insert(0, root)
+    os.chdir(root)
+
+    port = int(os.environ.get("CELLPOINT_PORT", 8501))
+    flag_options = {
+        "global.developmentMode": False,
+        "server.port": port,
+        "server.headless": False,
+        "server.fileWatcherType": "none",
+        "server.runOnSave": False,
+        "browser.gatherUsageStats": False,
+    }
+
+    threading.Thread(target=prewarm, name="cellpoint-prewarm", daemon=True).start()
+    threading.Thread(target=report_ready, args=(port,), name="cellpoint-ready", daemon=True).start()
+
+    from streamlit.web import bootstrap
+
+    bootstrap.load_config_options(flag_options)
+    bootstrap.run(os.path.join(root, "main.py"), False, [], flag_options)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,63 @@
 # -*- mode: python ; coding: utf-8 -*-
+#
+# pyinstaller main.spec  →  dist/CELLPOINT/CELLPOINT(.exe)
+#
+# launcher.py boots the Streamlit server in-process. main.py and pages/
+# ship as data files because Streamlit runs them from disk, so their
+# imports are listed explicitly below. One-folder build with UPX off:
+# nothing is unpacked or decompressed on every start.
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules, copy_metadata
+
+
+datas = [
+    ('main.py', '.'),
+    ('pages', 'pages'),
+]
+datas += collect_data_files('streamlit')
+datas += copy_metadata('streamlit')
+
+# Imported by the pages (run as data) or lazily by name
+hiddenimports = collect_submodules('cellpoint') + [
+    'streamlit.web.bootstrap',
+    'openpyxl',
+    'python_calamine',
+    'pyarrow',
+    'reportlab',
+    'matplotlib.backends.backend_agg',
+]
+
+excludes = [
+    'tkinter',
+    'IPython',
+    'jupyter_client',
+    'notebook',
+    'pytest',
+    'scipy',
+    'sklearn',
+    'PyQt5',
+    'PyQt6',
+    'PySide2',
+    'PySide6',
+    'matplotlib.backends.backend_qtagg',
+    'matplotlib.backends.backend_tkagg',
+    'matplotlib.backends.backend_webagg',
+    'sqlalchemy',
+    'tables',
+    'benchmarks',
+]
 
 
 a = Analysis(
-    ['main.py'],
+    ['launcher.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=[],
+    datas=datas,
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     noarchive=False,
     optimize=0,
 )
@@ -19,16 +66,13 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
-    name='main',
+    exclude_binaries=True,
+    name='CELLPOINT',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +80,13 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='CELLPOINT',
+)
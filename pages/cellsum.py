@@ -1,13 +1,14 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import calendar
 from datetime import date
-from io import BytesIO
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
+
+from cellpoint.analytics import (
+    cellsum_table, month_progress, mri_assessment, mri_summary, store_contribution,
+    store_universe, universe_summary
+)
+from cellpoint.bands import COMPANY_STATUS, MRI_STATUS
+from cellpoint.mtd import day_totals, record_day
+from cellpoint.reports import report_key
+from cellpoint.ui import combined_digest, report_download, store_frames
 
 
 # ======================================================
@@ -26,11 +27,7 @@ st.subheader("Owner Intelligence • CELLSUM • MRI • Store Control")
 # ======================================================
 report_date = st.date_input("📅 Report As On Date", value=date.today())
 
-year = report_date.year
-month = report_date.month
-days_completed = report_date.day
-total_days = calendar.monthrange(year, month)[1]
-days_remaining = total_days - days_completed
+days_completed, total_days, days_remaining = month_progress(report_date)
 
 st.caption(
     f"📆 Month Days: {total_days} | "
@@ -43,238 +40,38 @@ st.markdown("---")
 # ======================================================
 # FILE UPLOAD
 # ======================================================
-file_cp1 = st.file_uploader("📂 Upload CellPoint 1 Excel", type=["xlsx"])
-file_cp2 = st.file_uploader("📂 Upload CellPoint 2 Excel", type=["xlsx"])
-
-# ======================================================
-# HELPERS
-# ======================================================
-def load_branch_excel(file):
-    df = pd.read_excel(file)
-    df.columns = df.columns.str.strip().str.upper()
-    df = df[~df["BRAND NAME"].astype(str).str.contains("TOTAL", case=False)]
-    for col in ["MONTHLY TARGET", "ACHIEVEMENT", "BALANCE TO DO", "DAILY TARGET"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-    return df
-
-# ---------- CELLSUM RISK ----------
-def cellsum_risk(p):
-    if p > 100: return "🟢 Extra Ordinary"
-    elif p >= 91: return "🟢 Excellent"
-    elif p >= 61: return "🟡 Good"
-    elif p >= 31: return "🟠 Average"
-    else: return "🔴 Very High"
-
-def cellsum_rank(r):
-    return {
-        "🟢 Extra Ordinary": 1,
-        "🟢 Excellent": 2,
-        "🟡 Good": 3,
-        "🟠 Average": 4,
-        "🔴 Very High": 5
-    }.get(r, 99)
-
-# ---------- MRI RISK ----------
-def mri_risk(p):
-    if p >= 100: return "🟢 Aligned"
-    elif p >= 85: return "🟡 Slight Gap"
-    elif p >= 70: return "🟠 Misaligned"
-    else: return "🔴 High Risk"
-
-def mri_rank(r):
-    return {
-        "🟢 Aligned": 1,
-        "🟡 Slight Gap": 2,
-        "🟠 Misaligned": 3,
-        "🔴 High Risk": 4
-    }.get(r, 99)
-
-def company_status(p):
-    if p > 100: return "🟢 EXTRA ORDINARY"
-    elif p >= 91: return "🟢 EXCELLENT"
-    elif p >= 61: return "🟡 GOOD"
-    elif p >=31: return "🟠 AVERAGE"
-    else: return "🔴 CRITICAL"
-
-# ======================================================
-# MRI PERMANENT TARGETS (₹ in Lakhs)
-# ======================================================
-MRI_TARGETS = {
-    "IPHONE": 70,
-    "REALME": 32,
-    "OPPO": 31,
-    "VIVO": 45,
-    "NOTHING": 15,
-    "REDMI": 10,
-    "MOTO": 20,
-    "OTHERS": 10,
-    "SAMSUNG": 20,
-    "ONEPLUS": 25
-}
-# ======================================================
-# PDF GENERATOR – CELLSUM & MRI
-# ======================================================
-
-def generate_cellsum_mri_pdf(
-    cellsum_df, total_trgt, total_ach, total_pct,
-    run_rate, predicted_final, cellsum_carrier,
-    mri_df, mri_pct
-):
-
-    buffer = BytesIO()
-
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=20,
-        leftMargin=20,
-        topMargin=20,
-        bottomMargin=20
-    )
-
-    styles = getSampleStyleSheet()
-
-    def color_status(text):
-        if "🟢" in text:
-           return Paragraph(f"<font color='green'>{text}</font>", styles["Normal"])
-        elif "🟡" in text:
-           return Paragraph(f"<font color='orange'>{text}</font>", styles["Normal"])
-        elif "🟠" in text:
-           return Paragraph(f"<font color='#d35400'>{text}</font>", styles["Normal"])
-        elif "🔴" in text:
-           return Paragraph(f"<font color='red'>{text}</font>", styles["Normal"])
-        else:
-           return Paragraph(text, styles["Normal"])
-
-    elements = []
-
-    # ---------------- HEADER ----------------
-    elements.append(Paragraph(
-        "<b>CELLPOINT – CELLSUM & MRI REPORT</b><br/>"
-        "Owner Intelligence Summary<br/><br/>",
-        styles["Title"]
-    ))
-
-    # ---------------- SUMMARY ----------------
-    elements.append(Paragraph(
-        f"<b>Total Target:</b> ₹{int(total_trgt):,}<br/>"
-        f"<b>Total Achieved:</b> ₹{int(total_ach):,}<br/>"
-        f"<b>Achievement %:</b> {total_pct:.1f}%<br/>"
-        f"<b>Run Rate:</b> ₹{run_rate/1e5:.2f} L / day<br/>"
-        f"<b>Predicted Final:</b> ₹{int(predicted_final):,}<br/>"
-        f"<b>CELLSUM Carrier:</b> {cellsum_carrier}<br/><br/>",
-        styles["Normal"]
-    ))
-
-    # ---------------- CELLSUM TABLE ----------------
-    elements.append(Paragraph("<b>Brand Performance Summary</b>", styles["Heading2"]))
-
-    table_data = [[
-        "Brand", "Target", "Achieved", "Achievement %", "Risk Level"
-    ]]
-
-    for _, r in cellsum_df.iterrows():
-        table_data.append([
-            r["BRAND NAME"],
-            f"{int(r['MONTHLY TARGET']):,}",
-            f"{int(r['ACHIEVEMENT']):,}",
-            f"{r['ACHIEVEMENT %']:.1f}%",
-            color_status(r["RISK LEVEL"])
-        ])
-
-    table = Table(table_data, repeatRows=1)
-    table.setStyle(TableStyle([
-        ("GRID", (0,0), (-1,-1), 0.4, colors.black),
-        ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
-        ("FONTSIZE", (0,0), (-1,-1), 8),
-        ("ALIGN", (1,1), (-1,-1), "CENTER"),
-    ]))
-
-    elements.append(table)
-
-
-    # ---------------- MRI SECTION ----------------
-    elements.append(Spacer(1, 16))
-    elements.append(Paragraph(
-    "<b>🧠 MRI – Internal Brand-Mix Intelligence</b>",
-    styles["Heading2"]
-))
-
-    elements.append(Paragraph(
-    f"<b>Overall MRI Alignment:</b> "
-    f"{color_status(mri_risk(mri_pct)).text} "
-    f"({mri_pct:.1f}%)<br/><br/>",
-    styles["Normal"]
-))
-
-
-    mri_table = [[
-    "Brand", "MRI Target", "Achieved", "MRI %", "MRI Status"
-]]
-
-    for _, r in mri_df.iterrows():
-        mri_table.append([
-        r["BRAND NAME"],
-        f"{int(r['MRI TARGET']):,}",
-        f"{int(r['ACHIEVEMENT']):,}",
-        f"{r['MRI %']:.1f}%",
-        color_status(r["MRI STATUS"])
-    ])
-
-    tbl = Table(mri_table, repeatRows=1)
-    tbl.setStyle(TableStyle([
-    ("GRID", (0,0), (-1,-1), 0.4, colors.black),
-    ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
-    ("FONTSIZE", (0,0), (-1,-1), 8),
-    ("ALIGN", (1,1), (-1,-1), "CENTER"),
-]))
-
-    elements.append(tbl)
-
-
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
-    
-
-
-
+store_files = st.file_uploader(
+    "📂 Upload one Excel per store",
+    type=["xlsx"],
+    accept_multiple_files=True
+)
+st.caption("Each file is one store, named after the file (e.g. CellPoint 1.xlsx)")
 
 # ======================================================
 # MAIN LOGIC
 # ======================================================
-if file_cp1 and file_cp2:
+# ---------------- LOAD (UPLOADS, ELSE SAVED HISTORY) ----------------
+stores, store_digests = store_frames(store_files, "cellsum", report_date, on_save=record_day)
+
+if stores:
 
-    # ---------------- LOAD ----------------
-    df1 = load_branch_excel(file_cp1)
-    df2 = load_branch_excel(file_cp2)
+    # One store-tagged frame for every store in the universe
+    universe = store_universe(stores)
 
     # ======================================================
-    # CELLSUM (UNIVERSE)
+    # CELLSUM (UNIVERSE) – BEST → WORST
     # ======================================================
-    cellsum_df = (
-        pd.concat([df1, df2])
-        .groupby("BRAND NAME", as_index=False)
-        .sum()
-    )
-
-    cellsum_df["ACHIEVEMENT %"] = (
-        cellsum_df["ACHIEVEMENT"] / cellsum_df["MONTHLY TARGET"] * 100
-    )
-    cellsum_df["RISK LEVEL"] = cellsum_df["ACHIEVEMENT %"].apply(cellsum_risk)
-    cellsum_df["RANK"] = cellsum_df["RISK LEVEL"].apply(cellsum_rank)
-
-    # BEST → WORST hierarchy
-    cellsum_df = cellsum_df.sort_values(
-        ["RANK", "ACHIEVEMENT %"], ascending=[True, False]
-    ).drop(columns="RANK")
-
-    total_ach = cellsum_df["ACHIEVEMENT"].sum()
-    total_trgt = cellsum_df["MONTHLY TARGET"].sum()
-    total_pct = (total_ach / total_trgt) * 100
-
-    run_rate = total_ach / days_completed if days_completed > 0 else 0
-    predicted_final = total_ach + run_rate * days_remaining
+    cellsum_df = cellsum_table(universe)
+
+    # Run rate from the per-store month-to-date ledgers (read-only; the
+    # Save as action above is what records a day)
+    run_rate = sum(day_totals(name, report_date, stores[name])["run_rate"] for name in stores)
+
+    summary = universe_summary(cellsum_df, run_rate, days_remaining)
+    total_ach = summary["total_ach"]
+    total_trgt = summary["total_trgt"]
+    total_pct = summary["total_pct"]
+    predicted_final = summary["predicted_final"]
 
     # ======================================================
     # CELLSUM SNAPSHOT
@@ -286,7 +83,7 @@ if file_cp1 and file_cp2:
     c2.metric("✅ Achieved", f"₹{int(total_ach):,}", f"{total_pct:.1f}%")
     c3.metric("📈 Run Rate", f"₹{run_rate/1e5:.2f} L / day")
     c4.metric("🔮 Predicted", f"₹{int(predicted_final):,}")
-    c5.metric("🏢 Status", company_status(total_pct))
+    c5.metric("🏢 Status", COMPANY_STATUS.label(total_pct))
 
     st.subheader("📋 Brand Performance (Best → Worst)")
     st.dataframe(cellsum_df, use_container_width=True)
@@ -294,24 +91,17 @@ if file_cp1 and file_cp2:
     # ======================================================
     # STORE CONTRIBUTION – CELLSUM
     # ======================================================
-    cp1_cellsum = df1["ACHIEVEMENT"].sum()
-    cp2_cellsum = df2["ACHIEVEMENT"].sum()
-    universe_total = cp1_cellsum + cp2_cellsum
-
-    cp1_pct = (cp1_cellsum / universe_total) * 100
-    cp2_pct = (cp2_cellsum / universe_total) * 100
+    store_df = store_contribution(universe)
 
     st.markdown("## 🏬 Store Contribution – CELLSUM")
 
-    c1, c2, c3 = st.columns(3)
-    c1.metric("🏬 CP1 Contribution", f"₹{int(cp1_cellsum):,}", f"{cp1_pct:.1f}%")
-    c2.metric("🏬 CP2 Contribution", f"₹{int(cp2_cellsum):,}", f"{cp2_pct:.1f}%")
+    # From ACHIEVEMENT: every % is 0 on a month's first (all-zero) sheets
+    cellsum_carrier = store_df["ACHIEVEMENT"].idxmax()
 
-    cellsum_carrier = "CellPoint 1" if cp1_pct > cp2_pct else "CellPoint 2"
-    c3.metric("💪 CELLSUM Carrier", cellsum_carrier)
-
-
-   
+    cols = st.columns(len(store_df) + 1)
+    for col, (store, r) in zip(cols, store_df.iterrows()):
+        col.metric(f"🏬 {store}", f"₹{int(r['ACHIEVEMENT']):,}", f"{r['CONTRIBUTION %']:.1f}%")
+    cols[-1].metric("💪 CELLSUM Carrier", cellsum_carrier)
 
     # ======================================================
     # MRI – INTERNAL DETAILED ANALYSIS
@@ -320,55 +110,59 @@ if file_cp1 and file_cp2:
     st.markdown("## 🧠 MRI – Internal Brand-Mix Intelligence")
     st.caption("🔒 Internal only • Strategic view")
 
-    if st.button("🚨 Run MRI Assessment"):
+    cellsum_digest = combined_digest(store_digests)
 
-        # -------- MRI BRAND LEVEL --------
-        mri_df = cellsum_df.copy()
-        mri_df["BRAND NAME"] = mri_df["BRAND NAME"].str.upper()
+    # The assessment survives reruns until the uploads change; a new
+    # report date only redoes the run-rate / prediction figures.
+    assessment = st.session_state.get("mri_assessment")
+    if assessment is not None and assessment["digest"] != cellsum_digest:
+        del st.session_state["mri_assessment"]
+        assessment = None
 
-        mri_targets_df = pd.DataFrame([
-            {"BRAND NAME": k, "MRI TARGET": v * 1_00_000}
-            for k, v in MRI_TARGETS.items()
-        ])
+    if st.button("🚨 Run MRI Assessment") and assessment is None:
+        assessment = {
+            "digest": cellsum_digest,
+            "report_date": None,
+            **mri_assessment(universe, store_df.index)
+        }
+        st.session_state["mri_assessment"] = assessment
 
-        mri_df = mri_df.merge(mri_targets_df, on="BRAND NAME", how="inner")
+    if assessment is not None:
 
-        mri_df["MRI %"] = (mri_df["ACHIEVEMENT"] / mri_df["MRI TARGET"]) * 100
-        mri_df["MRI STATUS"] = mri_df["MRI %"].apply(mri_risk)
-        mri_df["RANK"] = mri_df["MRI STATUS"].apply(mri_rank)
+        # -------- MRI BRAND LEVEL --------
+        mri_df = assessment["mri_df"]
 
-        # BEST → WORST hierarchy
-        mri_df = mri_df.sort_values(
-            ["RANK", "MRI %"], ascending=[True, False]
-        ).drop(columns="RANK")
+        # -------- MRI TOTALS (DAY-DEPENDENT) --------
+        if assessment["report_date"] != report_date:
+            assessment["mri"] = mri_summary(mri_df, days_completed, days_remaining)
+            assessment["report_date"] = report_date
 
-        # -------- MRI TOTALS --------
-        mri_ach = mri_df["ACHIEVEMENT"].sum()
-        mri_trgt = mri_df["MRI TARGET"].sum()
-        mri_run = mri_ach / days_completed if days_completed > 0 else 0
-        mri_pred = mri_ach + mri_run * days_remaining
-        mri_pct = (mri_pred / mri_trgt) * 100
+        mri = assessment["mri"]
+        mri_ach = mri["mri_ach"]
+        mri_trgt = mri["mri_trgt"]
+        mri_run = mri["mri_run"]
+        mri_pred = mri["mri_pred"]
+        mri_pct = mri["mri_pct"]
 
 
          # ================= DOWNLOAD REPORT =================
         st.markdown("## 📄 Download CELLSUM Intelligence Report")
 
-        st.download_button(
+        report_download(
         "⬇️ Download A4 CELLSUM Intelligence Report",
-        generate_cellsum_mri_pdf(
-            cellsum_df,
-            total_trgt,
-            total_ach,
-            total_pct,
-            run_rate,
-            predicted_final,
-            cellsum_carrier,
-            mri_df,
-            mri_pct
-        ),
         "CELLPOINT_CELLSUM_MRI_Report.pdf",
-        "application/pdf"
-    )
+        report_key("cellsum", cellsum_digest, report_date),
+        "cellpoint.pdf:generate_cellsum_mri_pdf",
+        cellsum_df,
+        total_trgt,
+        total_ach,
+        total_pct,
+        run_rate,
+        predicted_final,
+        cellsum_carrier,
+        mri_df,
+        mri_pct
+        )
 
         # -------- MRI SNAPSHOT --------
         st.markdown("### 🧠 MRI Snapshot")
@@ -378,7 +172,7 @@ if file_cp1 and file_cp2:
         c2.metric("✅ MRI Achieved", f"₹{int(mri_ach):,}", f"{(mri_ach/mri_trgt)*100:.1f}%")
         c3.metric("📈 MRI Run Rate", f"₹{mri_run/1e5:.2f} L / day")
         c4.metric("🔮 MRI Predicted", f"₹{int(mri_pred):,}")
-        c5.metric("🏢 MRI Status", mri_risk(mri_pct))
+        c5.metric("🏢 MRI Status", MRI_STATUS.label(mri_pct))
 
         st.subheader("📋 MRI Brand Analysis (Best → Worst)")
         st.dataframe(mri_df[[
@@ -390,27 +184,16 @@ if file_cp1 and file_cp2:
         ]], use_container_width=True)
 
         # -------- STORE MRI CONTRIBUTION --------
-        def store_mri_ach(df):
-            d = df.copy()
-            d["BRAND NAME"] = d["BRAND NAME"].str.upper()
-            d = d.merge(mri_targets_df, on="BRAND NAME", how="inner")
-            return d["ACHIEVEMENT"].sum()
-
-        cp1_mri = store_mri_ach(df1)
-        cp2_mri = store_mri_ach(df2)
-        mri_total = cp1_mri + cp2_mri
-
-        cp1_mri_pct = (cp1_mri / mri_total) * 100 if mri_total else 0
-        cp2_mri_pct = (cp2_mri / mri_total) * 100 if mri_total else 0
+        mri_store_df = assessment["mri_store_df"]
 
         st.markdown("### 🏬 MRI – Store Contribution")
 
-        c1, c2, c3 = st.columns(3)
-        c1.metric("🏬 CP1 MRI", f"₹{int(cp1_mri):,}", f"{cp1_mri_pct:.1f}%")
-        c2.metric("🏬 CP2 MRI", f"₹{int(cp2_mri):,}", f"{cp2_mri_pct:.1f}%")
+        mri_carrier = assessment["mri_carrier"]
 
-        mri_carrier = "CellPoint 1" if cp1_mri_pct > cp2_mri_pct else "CellPoint 2"
-        c3.metric("⚠️ MRI Carrier", mri_carrier)
+        cols = st.columns(len(mri_store_df) + 1)
+        for col, (store, r) in zip(cols, mri_store_df.iterrows()):
+            col.metric(f"🏬 {store} MRI", f"₹{int(r['ACHIEVEMENT']):,}", f"{r['CONTRIBUTION %']:.1f}%")
+        cols[-1].metric("⚠️ MRI Carrier", mri_carrier)
 
         if cellsum_carrier != mri_carrier:
             st.error(
@@ -419,4 +202,4 @@ if file_cp1 and file_cp2:
             )
 
 else:
-    st.info("⬆️ Upload BOTH Excel files to start analysis")
+    st.info("⬆️ Upload store Excel files to start analysis")